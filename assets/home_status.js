@@ -0,0 +1,72 @@
+/*
+ * Banner de estado general del home.
+ * Se construye en el navegador a partir de los indicadores que el callback
+ * update_system_status deja en el dcc.Store "system-status-flags".
+ */
+(function () {
+    function component(namespace, type, props) {
+        return {namespace: namespace, type: type, props: props};
+    }
+
+    function htmlComponent(type, props) {
+        return component('dash_html_components', type, props);
+    }
+
+    function renderStatusBanner(flags) {
+        if (!flags) {
+            return null;
+        }
+
+        var performance = flags.performance_data_available;
+        var injuries = flags.injuries_available;
+        var updates = flags.updates_available || [];
+
+        var color, message;
+        if (performance && injuries) {
+            color = 'success';
+            message = 'All systems operational';
+        } else if (performance || injuries) {
+            color = 'warning';
+            message = 'Partial systems operational';
+        } else {
+            color = 'danger';
+            message = 'Systems not available';
+        }
+
+        var content = [
+            htmlComponent('Strong', {children: '🔧 Status: '}),
+            component('dash_bootstrap_components', 'Badge', {
+                children: message, color: color, className: 'ms-2'
+            })
+        ];
+
+        if (updates.length) {
+            content.push(
+                htmlComponent('Br', {}),
+                htmlComponent('Br', {}),
+                htmlComponent('Strong', {children: '🔔 Updates Available: '}),
+                htmlComponent('Br', {}),
+                htmlComponent('Small', {
+                    children: '• ' + updates.join(', ') + ' can be updated',
+                    className: 'text-warning'
+                })
+            );
+        } else {
+            content.push(
+                htmlComponent('Br', {}),
+                htmlComponent('Small', {
+                    children: '✅ All data is up to date',
+                    className: 'text-success'
+                })
+            );
+        }
+
+        return htmlComponent('Div', {children: content});
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        home: Object.assign({}, (window.dash_clientside || {}).home, {
+            renderStatusBanner: renderStatusBanner
+        })
+    });
+})();
@@ -2,7 +2,7 @@
 Callbacks para la página home.
 Versión simplificada y modularizada.
 """
-from dash import Input, Output, callback
+from dash import Input, Output, State, Patch, ctx, callback, clientside_callback, ClientsideFunction
 import dash_bootstrap_components as dbc
 from dash import html
 from data import HongKongDataManager
@@ -12,7 +12,8 @@ from utils.home_helpers import (
     create_performance_section,
     create_performance_status_section,
     create_injuries_section,
-    create_overall_status_section,
+    patch_injuries_section,
+    get_overall_status_flags,
     create_update_results_section
 )
 import logging
@@ -109,19 +110,24 @@ def update_injuries_data(transfermarkt_manager, force_update=False):
         return False, error_msg
 
 @callback(
-    Output('system-status-info', 'children'),
+    [Output('system-status-info', 'children'),
+    Output('system-status-flags', 'data')],
     [Input('refresh-data-button', 'n_clicks'),
     Input('url', 'pathname')],
+    State('system-status-flags', 'data'),
     prevent_initial_call=False
 )
-def update_system_status(n_clicks, pathname):
+def update_system_status(n_clicks, pathname, previous_flags):
     """
     Callback principal que actualiza la información del estado del sistema.
     Versión optimizada sin verificaciones duplicadas.
+    
+    Si la lista ya está en pantalla (hay indicadores previos) y el disparo es
+    el botón de actualizar, devuelve un Patch en lugar del árbol completo.
     """
     # Solo ejecutar en la página home
     if pathname != "/":
-        return None
+        return None, None
     
     try:
         # Mostrar loading si se está actualizando
@@ -205,6 +211,36 @@ def update_system_status(n_clicks, pathname):
         performance_data_available = len(cached_seasons) > 0
         injuries_available = len(injuries_data) > 0
         
+        # Equipos con lesiones: una sola consulta compartida por las secciones
+        teams_with_injuries = tm.get_teams_with_injuries() if injuries_available else []
+        
+        # Estado general: el banner se pinta en cliente desde el Store
+        status_flags = get_overall_status_flags(
+            performance_data_available, 
+            injuries_available, 
+            dm  # data_manager
+        )
+        
+        # Resultados de actualización (manual o automática)
+        update_results_item = create_update_results_section(
+            performance_updated, injuries_updated, performance_status, injuries_data,
+            teams_with_injuries, update_errors
+        )
+        # Hueco fijo para que la lista tenga siempre la misma estructura
+        update_results_slot = update_results_item or html.Div()
+        
+        # Refresco con la lista ya renderizada: enviar solo lo que cambia
+        if ctx.triggered_id == 'refresh-data-button' and previous_flags is not None:
+            status_patch = Patch()
+            patched_items = status_patch['props']['children']
+            patched_items[0] = create_performance_section(performance_status)
+            patched_items[1] = create_performance_status_section(performance_status)
+            patch_injuries_section(
+                patched_items[2], injuries_data, injuries_stats, tm, teams_with_injuries=teams_with_injuries
+            )
+            patched_items[4] = update_results_slot
+            return status_patch, status_flags
+        
         # Crear secciones usando las funciones auxiliares
         status_items = []
         
@@ -213,24 +249,14 @@ def update_system_status(n_clicks, pathname):
         status_items.append(create_performance_status_section(performance_status))
         
         # Sección de injuries
-        status_items.append(create_injuries_section(injuries_data, injuries_stats, tm))
-        
-        # Estado general
-        status_items.append(create_overall_status_section(
-            performance_data_available, 
-            injuries_available, 
-            dm,  # data_manager
-            tm   # transfermarkt_manager    
+        status_items.append(create_injuries_section(
+            injuries_data, injuries_stats, tm, teams_with_injuries=teams_with_injuries
         ))
         
-        # Resultados de actualización (manual o automática)
-        update_results_item = create_update_results_section(
-            performance_updated, injuries_updated, dm, tm, update_errors
-        )
-        if update_results_item:
-            status_items.append(update_results_item)
+        status_items.append(dbc.ListGroupItem(id='system-status-banner', color="light"))
+        status_items.append(update_results_slot)
         
-        return dbc.ListGroup(status_items, flush=True)
+        return dbc.ListGroup(status_items, flush=True), status_flags
         
     except Exception as e:
         # Error handler simplificado
@@ -243,4 +269,10 @@ def update_system_status(n_clicks, pathname):
                 html.Small("Please verify that the data system is properly configured.", className="text-muted"),
             ],
             color="danger"
-        )
\ No newline at end of file
+        ), None
+
+clientside_callback(
+    ClientsideFunction(namespace='home', function_name='renderStatusBanner'),
+    Output('system-status-banner', 'children'),
+    Input('system-status-flags', 'data')
+)
\ No newline at end of file
@@ -23,7 +23,7 @@ from utils.injury_helpers import (
     get_stats_with_fallback, create_distribution_chart_data,
     prepare_table_data, get_monthly_trends_data, get_body_parts_distribution
 )
-from utils.pdf_generator import SportsPDFGenerator
+from utils.pdf_generator import SportsPDFGenerator, release_buffer
 
 # Importar gestor de datos
 from data.transfermarkt_data_manager import TransfermarktDataManager
@@ -507,9 +507,12 @@ def export_injury_report(n_clicks, data, filters):
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"reporte_lesiones_transfermarkt_{timestamp}.pdf"
         
+        # Copiar los bytes y devolver el buffer al pool del generador
+        pdf_bytes = pdf_buffer.getvalue()
+        release_buffer(pdf_buffer)
+        
         # Usar dcc.send_bytes para consistencia con performance_callbacks
-     
-        return send_bytes(pdf_buffer.getvalue(), filename)
+        return send_bytes(pdf_bytes, filename)
         
     except Exception as e:
         # Fallback a CSV
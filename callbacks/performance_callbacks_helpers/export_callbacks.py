@@ -46,7 +46,7 @@ def export_performance_pdf(n_clicks, performance_data, filters):
             filters = {"analysis_level": "league"}  # Valor por defecto
 
         # Importar generador
-        from utils.pdf_generator import SportsPDFGenerator
+        from utils.pdf_generator import SportsPDFGenerator, release_buffer
 
         # Determinar análisis level y filename
         analysis_level = filters.get('analysis_level', 'league')
@@ -71,8 +71,12 @@ def export_performance_pdf(n_clicks, performance_data, filters):
             performance_data, filters
         )
 
+        # Copiar los bytes y devolver el buffer al pool del generador
+        pdf_bytes = pdf_buffer.getvalue()
+        release_buffer(pdf_buffer)
+
         # Usar send_bytes para manejar automáticamente los bytes
-        return send_bytes(pdf_buffer.getvalue(), filename)
+        return send_bytes(pdf_bytes, filename)
 
     except Exception as e:
         # En caso de error, crear un archivo de texto con información de debug
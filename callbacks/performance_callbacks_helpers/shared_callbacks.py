@@ -18,7 +18,7 @@ data_manager = HongKongDataManager(auto_load=True)
 
 
 # Import additional utilities for KPIs
-from utils.common import create_kpi_cards_row, safe_get_analysis_level, validate_filters
+from utils.common import create_kpi_cards_row, validate_filters_with_level
 from utils.performance_helpers import (
     validate_performance_data,
     get_analysis_title,
@@ -248,8 +248,7 @@ def update_main_kpis(performance_data, filters):
         title = get_analysis_title(filters, performance_data)
 
         # Validar filtros y obtener nivel de análisis
-        filters = validate_filters(filters)
-        analysis_level = safe_get_analysis_level(filters)
+        filters, analysis_level = validate_filters_with_level(filters)
 
         # Crear estructura de KPIs usando función auxiliar
         kpi_data = create_kpi_structure(analysis_level, performance_data)
@@ -65,6 +65,8 @@ layout = html.Div([
                                     type="default",
                                     color="#6ea4da"
                                 ),
+                                # Indicadores para el banner de estado (clientside)
+                                dcc.Store(id="system-status-flags"),
                                 dbc.Button(
                                     [
                                         html.I(className="bi bi-arrow-clockwise me-2"),  # Icono de actualizar
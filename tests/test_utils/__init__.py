@@ -0,0 +1,2 @@
+# ABOUTME: Test package initialization for utils tests
+# ABOUTME: Enables pytest discovery of utility module tests
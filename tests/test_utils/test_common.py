@@ -0,0 +1,91 @@
+# ABOUTME: Tests for the shared helpers in utils.common
+# ABOUTME: Validates the memoized formatters and the filter validation
+
+from datetime import datetime
+
+from utils.common import (
+    format_season_short,
+    format_datetime,
+    validate_filters,
+    safe_get_analysis_level,
+    validate_filters_with_level
+)
+
+
+class TestFormatSeasonShort:
+    """Tests for format_season_short."""
+
+    def test_shortens_season(self):
+        """Should turn '2024-25' into '24/25'."""
+        assert format_season_short('2024-25') == '24/25'
+
+    def test_returns_unknown_formats_unchanged(self):
+        """Should return values without a dash as they are."""
+        assert format_season_short('N/A') == 'N/A'
+        assert format_season_short('') == ''
+        assert format_season_short(None) is None
+
+    def test_repeated_calls_hit_cache(self):
+        """Should answer a repeated season from the cache."""
+        format_season_short.cache_clear()
+        for _ in range(3):
+            format_season_short('2023-24')
+
+        info = format_season_short.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+
+class TestFormatDatetime:
+    """Tests for format_datetime."""
+
+    def test_formats_datetime(self):
+        """Should format datetime objects down to the second."""
+        assert format_datetime(datetime(2025, 1, 2, 10, 30, 5, 999)) == '2025-01-02 10:30:05'
+
+    def test_parses_iso_strings(self):
+        """Should parse ISO strings, including a trailing Z."""
+        assert format_datetime('2025-01-02T10:30:05') == '2025-01-02 10:30:05'
+        assert format_datetime('2025-01-02T10:30:05Z') == '2025-01-02 10:30:05'
+
+    def test_truncates_unparsable_strings(self):
+        """Should fall back to the first 19 characters of unparsable strings."""
+        assert format_datetime('2025-01-02T10:30:05 UTC+8') == '2025-01-02 10:30:05'
+        assert format_datetime('ayer') == 'ayer'
+
+    def test_missing_values_are_never(self):
+        """Should return 'Nunca' for None, placeholder strings and other types."""
+        for value in (None, 'None', 'null', '{}', {}, ['2025-01-02'], 12):
+            assert format_datetime(value) == 'Nunca'
+
+
+class TestValidateFiltersWithLevel:
+    """Tests for validate_filters_with_level."""
+
+    def test_returns_filters_and_level(self):
+        """Should return the validated filters together with their level."""
+        filters = {'analysis_level': 'team', 'season': '2024-25'}
+
+        validated, level = validate_filters_with_level(filters)
+
+        assert validated is filters
+        assert level == 'team'
+
+    def test_adds_default_level(self):
+        """Should add the default level to filters that lack one."""
+        filters = {'season': '2024-25'}
+
+        assert validate_filters_with_level(filters) == ({'season': '2024-25', 'analysis_level': 'league'}, 'league')
+        assert validate_filters_with_level({}, 'player')[1] == 'player'
+
+    def test_invalid_filters(self):
+        """Should replace missing or non-dict filters with the default level."""
+        assert validate_filters_with_level(None) == ({'analysis_level': 'league'}, 'league')
+        assert validate_filters_with_level(['team']) == ({'analysis_level': 'league'}, 'league')
+
+    def test_matches_two_step_validation(self):
+        """Should agree with validate_filters followed by safe_get_analysis_level."""
+        for filters in (None, {}, {'analysis_level': 'player'}, {'analysis_level': None}):
+            expected_filters = validate_filters(dict(filters) if filters is not None else None)
+            expected = (expected_filters, safe_get_analysis_level(expected_filters))
+
+            assert validate_filters_with_level(dict(filters) if filters is not None else None) == expected
@@ -0,0 +1,246 @@
+# ABOUTME: Tests for EfficiencyMetricsCalculator and PercentileRankingSystem
+# ABOUTME: Validates metric coercion, the LRU percentile cache and its size counter
+
+import numpy as np
+import pandas as pd
+import pytest
+from utils.efficiency_metrics import (
+    EfficiencyMetricsCalculator,
+    PercentileRankingSystem,
+    _cache_entry_size
+)
+
+
+@pytest.fixture
+def mixed_dataframe() -> pd.DataFrame:
+    """Small squad with a numeric column stored as text outside NUMERIC_COLS."""
+    return pd.DataFrame({
+        'Player': ['P1', 'P2', 'P3', 'P4', 'P5'],
+        'Team': ['A', 'A', 'B', 'B', 'B'],
+        'Position_Group': ['Forward', 'Forward', 'Forward', 'Defender', 'Defender'],
+        'Goals': [1, 5, 3, 0, 2],
+        'Matches played': [6, 6, 6, 6, 6],
+        'Rating': ['7.0', '8.5', 'n/a', '6.0', '6.5'],
+    })
+
+
+class TestNumericColumns:
+    """Tests for lazy coercion of metrics outside NUMERIC_COLS."""
+
+    def test_identifier_metric_keeps_player_lookups(self, mixed_dataframe):
+        """Should still find players after using an identifier column as metric."""
+        calculator = EfficiencyMetricsCalculator(mixed_dataframe)
+        calculator.detect_efficiency_outliers('Player')
+
+        result = calculator.compare_to_benchmarks('P3', 'Goals')
+
+        assert result['player'] == 'P3'
+        assert result['player_value'] == 3.0
+        assert result['position_benchmark']['position'] == 'Forward'
+
+    def test_identifier_metric_keeps_ranking_lookups(self, mixed_dataframe):
+        """Should still rank by player and position after coercing Team."""
+        ranking = PercentileRankingSystem(mixed_dataframe)
+        ranking.get_league_rankings('Team', min_matches=0)
+        ranking.get_position_percentiles('Forward', 'Position_Group')
+
+        result = ranking.get_relative_ranking('P2', 'Goals')
+
+        assert result['rank'] == 1
+        assert result['total_in_position'] == 3
+        assert [r['player'] for r in ranking.get_position_rankings('Forward', 'Goals')] == ['P2', 'P3', 'P1']
+
+    def test_source_data_is_not_modified(self, mixed_dataframe):
+        """Should leave the caller's DataFrame untouched."""
+        original = mixed_dataframe.copy()
+        calculator = EfficiencyMetricsCalculator(mixed_dataframe)
+        calculator.detect_efficiency_outliers('Player')
+        calculator.compare_to_benchmarks('P1', 'Rating')
+
+        pd.testing.assert_frame_equal(mixed_dataframe, original)
+
+    def test_text_metric_is_coerced_to_numbers(self, mixed_dataframe):
+        """Should rank a text column by its numeric values, skipping unparsable ones."""
+        ranking = PercentileRankingSystem(mixed_dataframe)
+
+        result = ranking.get_league_rankings('Rating', min_matches=0)
+
+        assert [r['player'] for r in result] == ['P2', 'P1', 'P5', 'P4']
+        assert result[0]['value'] == 8.5
+
+    def test_views_are_not_modified(self, mixed_dataframe):
+        """Should leave the shared numeric and indexed views untouched."""
+        ranking = PercentileRankingSystem(mixed_dataframe)
+        columns = list(ranking._by_pos.columns)
+        ranking.get_league_rankings('Rating', min_matches=0)
+        ranking.get_position_rankings('Forward', 'Team')
+
+        assert list(ranking._by_pos.columns) == columns
+        assert list(ranking._num.columns) == columns
+        assert ranking._by_pos['Team'].tolist() == ['B', 'B', 'A', 'A', 'B']
+
+    def test_unknown_metric_returns_empty(self, mixed_dataframe):
+        """Should return empty results for a column that does not exist."""
+        ranking = PercentileRankingSystem(mixed_dataframe)
+
+        assert ranking.get_league_rankings('Missing') == []
+        assert ranking.get_position_percentiles('Forward', 'Missing') == {}
+
+
+class TestLazyViews:
+    """Tests for the numeric and indexed views built on first use."""
+
+    def test_construction_builds_no_views(self, processed_dataframe):
+        """Should not copy the data when the calculators are created."""
+        calculator = EfficiencyMetricsCalculator(processed_dataframe)
+        ranking = PercentileRankingSystem(processed_dataframe)
+
+        for instance in (calculator, ranking):
+            assert not {'_num', '_by_player', '_by_pos'} & set(vars(instance))
+
+    def test_views_are_built_once(self, processed_dataframe):
+        """Should reuse the same view across lookups."""
+        ranking = PercentileRankingSystem(processed_dataframe)
+        ranking.get_relative_ranking('Player 1', 'Goals')
+        by_pos = ranking._by_pos
+
+        ranking.get_position_rankings('Forward', 'Goals')
+
+        assert ranking._by_pos is by_pos
+
+
+class TestTopNOrder:
+    """Tests for top-N selection in the ranking methods."""
+
+    @pytest.fixture
+    def tied_dataframe(self) -> pd.DataFrame:
+        """Squad where several players tie at the top-N cutoff."""
+        goals = [5, 3, 3, 7, 3, 3, 1, 3]
+        return pd.DataFrame({
+            'Player': [f'P{i}' for i in range(len(goals))],
+            'Team': ['A'] * len(goals),
+            'Position_Group': ['Forward'] * len(goals),
+            'Goals': goals,
+            'Matches played': [10] * len(goals),
+        })
+
+    def test_ties_at_cutoff_keep_row_order(self, tied_dataframe):
+        """Should pick tied players at the cutoff in row order."""
+        ranking = PercentileRankingSystem(tied_dataframe)
+
+        result = ranking.get_league_rankings('Goals', min_matches=0, top_n=4)
+
+        assert [r['player'] for r in result] == ['P3', 'P0', 'P1', 'P2']
+
+    def test_matches_stable_descending_sort(self, tied_dataframe):
+        """Should match a stable descending sort for every top_n."""
+        ranking = PercentileRankingSystem(tied_dataframe)
+        expected = tied_dataframe.sort_values('Goals', ascending=False, kind='stable')['Player'].tolist()
+
+        for top_n in range(1, len(tied_dataframe) + 1):
+            result = ranking.get_position_rankings('Forward', 'Goals', top_n=top_n)
+            assert [r['player'] for r in result] == expected[:top_n]
+
+
+class TestComputeAllPercentiles:
+    """Tests for the precomputed percentile distributions."""
+
+    def test_matches_per_position_quantiles(self, processed_dataframe):
+        """Should cache the same values and cut points as a per-position pandas quantile."""
+        ranking = PercentileRankingSystem(processed_dataframe)
+        ranking.compute_all_percentiles(['Goals', 'xG'])
+
+        for position, group in processed_dataframe.groupby('Position_Group'):
+            for metric in ('Goals', 'xG'):
+                entry = ranking._percentile_cache[(position, metric)]
+                values = group[metric].astype(float)
+                expected = values.quantile([0.1, 0.25, 0.5, 0.75, 0.9]).to_numpy()
+
+                np.testing.assert_array_equal(entry['sorted'], np.sort(values.to_numpy()))
+                np.testing.assert_allclose(list(entry['quantiles'].values()), expected)
+
+    def test_caches_league_distribution(self, processed_dataframe):
+        """Should cache the league-wide distribution under position None."""
+        ranking = PercentileRankingSystem(processed_dataframe)
+        ranking.compute_all_percentiles(['Goals'])
+
+        entry = ranking._percentile_cache[(None, 'Goals')]
+
+        assert len(entry['sorted']) == len(processed_dataframe)
+        assert entry['quantiles']['50th'] == processed_dataframe['Goals'].median()
+
+    def test_drops_unparsable_values(self, mixed_dataframe):
+        """Should coerce text metrics and leave unparsable values out of the distributions."""
+        ranking = PercentileRankingSystem(mixed_dataframe)
+        ranking.compute_all_percentiles(['Rating'])
+
+        np.testing.assert_array_equal(ranking._percentile_cache[('Forward', 'Rating')]['sorted'], [7.0, 8.5])
+        np.testing.assert_array_equal(ranking._percentile_cache[(None, 'Rating')]['sorted'], [6.0, 6.5, 7.0, 8.5])
+
+    def test_ignores_unknown_metrics(self, mixed_dataframe):
+        """Should skip metrics that are not columns of the data."""
+        ranking = PercentileRankingSystem(mixed_dataframe)
+        ranking.compute_all_percentiles(['Missing'])
+
+        assert len(ranking._percentile_cache) == 0
+
+
+class TestCacheSize:
+    """Tests for the running size estimate of the percentile cache."""
+
+    def _cached_bytes(self, ranking):
+        return sum(_cache_entry_size(key, entry) for key, entry in ranking._percentile_cache.items())
+
+    def test_byte_counter_matches_entries(self, processed_dataframe):
+        """Should keep the size estimate equal to the entries held."""
+        ranking = PercentileRankingSystem(processed_dataframe)
+        for position in processed_dataframe['Position_Group'].unique():
+            ranking.get_position_percentiles(position, 'Goals')
+
+        assert ranking.get_cache_stats()['percentile_cache_size_bytes'] == self._cached_bytes(ranking)
+
+    def test_byte_counter_replaces_overwritten_entry(self, processed_dataframe):
+        """Should not count an entry twice when it is computed again."""
+        ranking = PercentileRankingSystem(processed_dataframe)
+        ranking.compute_all_percentiles(['Goals', 'xG'])
+        ranking.compute_all_percentiles(['Goals'])
+
+        assert ranking.get_cache_stats()['percentile_cache_size_bytes'] == self._cached_bytes(ranking)
+
+    def test_clear_cache_resets_counter(self, processed_dataframe):
+        """Should report zero bytes after clearing."""
+        ranking = PercentileRankingSystem(processed_dataframe)
+        ranking.compute_all_percentiles(['Goals'])
+        ranking.clear_cache()
+
+        assert ranking.get_cache_stats()['total_cache_size_bytes'] == 0
+
+
+class TestPercentileCacheEviction:
+    """Tests for the LRU bound of the percentile cache."""
+
+    def test_evicts_least_recently_used_entry(self, mixed_dataframe):
+        """Should evict the entry that was used least recently, not the oldest one."""
+        ranking = PercentileRankingSystem(mixed_dataframe, cache_maxsize=2)
+        ranking.get_position_percentiles('Forward', 'Goals')
+        ranking.get_position_percentiles('Defender', 'Goals')
+        ranking.get_position_percentiles('Forward', 'Goals')  # refresh
+        ranking.get_position_percentiles('Forward', 'Matches played')
+
+        assert list(ranking._percentile_cache) == [('Forward', 'Goals'), ('Forward', 'Matches played')]
+
+    def test_size_stays_bounded(self, processed_dataframe):
+        """Should never hold more than cache_maxsize entries."""
+        ranking = PercentileRankingSystem(processed_dataframe, cache_maxsize=3)
+        ranking.compute_all_percentiles(['Goals', 'xG', 'Assists'])
+
+        assert ranking.get_cache_stats()['percentile_cache_entries'] == 3
+
+    def test_evicted_entries_are_recomputed(self, processed_dataframe):
+        """Should return the same distribution after an entry was evicted."""
+        ranking = PercentileRankingSystem(processed_dataframe, cache_maxsize=1)
+        first = ranking.get_position_percentiles('Forward', 'Goals')
+        ranking.get_position_percentiles('Defender', 'Goals')
+
+        assert ranking.get_position_percentiles('Forward', 'Goals') == first
+        assert list(ranking._percentile_cache) == [('Forward', 'Goals')]
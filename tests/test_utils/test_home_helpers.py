@@ -0,0 +1,95 @@
+# ABOUTME: Tests for the home dashboard helpers in utils.home_helpers
+# ABOUTME: Validates the partial Patch refresh and the update results section
+
+import json
+
+import dash_bootstrap_components as dbc
+import plotly
+from dash import Patch
+from unittest.mock import Mock
+from utils.home_helpers import (
+    create_injuries_section,
+    patch_injuries_section,
+    create_update_results_section
+)
+
+INJURIES = [{'player_name': 'P1'}, {'player_name': 'P2'}, {'player_name': 'P3'}]
+STATS = {'active_injuries': 2, 'last_update': '2025-01-02T10:00:00'}
+
+
+def _to_json(value):
+    """Serialize a component tree the way Dash sends it to the browser."""
+    return json.loads(json.dumps(value, cls=plotly.utils.PlotlyJSONEncoder))
+
+
+def _apply_patch(tree, patch):
+    """Apply the Assign operations of a Patch to a serialized component tree."""
+    for operation in _to_json(patch.to_plotly_json())['operations']:
+        assert operation['operation'] == 'Assign'
+        *path, last = operation['location']
+        target = tree
+        for key in path:
+            target = target[key]
+        target[last] = operation['params']['value']
+    return tree
+
+
+class TestPatchInjuriesSection:
+    """Tests for the in-place refresh of the injuries section."""
+
+    def test_patch_matches_full_render(self):
+        """Should turn a rendered section into the full render of the new data."""
+        rendered = _to_json(create_injuries_section([], {}, None))
+        item_patch = Patch()
+
+        patch_injuries_section(item_patch, INJURIES, STATS, None, teams_with_injuries=['A', 'B'])
+
+        expected = _to_json(create_injuries_section(INJURIES, STATS, None, teams_with_injuries=['A', 'B']))
+        assert _apply_patch(rendered, item_patch) == expected
+
+    def test_patch_only_sends_changing_parts(self):
+        """Should assign the badge and the information block only."""
+        item_patch = Patch()
+        patch_injuries_section(item_patch, INJURIES, STATS, None, teams_with_injuries=['A'])
+
+        locations = [op['location'][-3:] for op in _to_json(item_patch.to_plotly_json())['operations']]
+
+        assert locations == [[3, 'props', 'children'], [3, 'props', 'color'], [5, 'props', 'children']]
+
+    def test_uses_teams_from_caller(self):
+        """Should not query the manager when teams are passed in."""
+        manager = Mock()
+        patch_injuries_section(Patch(), INJURIES, STATS, manager, teams_with_injuries=['A'])
+
+        manager.get_teams_with_injuries.assert_not_called()
+
+
+class TestUpdateResultsSection:
+    """Tests for create_update_results_section."""
+
+    def test_returns_none_without_updates(self):
+        """Should return None when nothing was updated and there are no errors."""
+        assert create_update_results_section(False, False, {}, [], [], []) is None
+
+    def test_summarizes_values_from_caller(self):
+        """Should build the summary from the status and injuries passed in."""
+        status = {'data_stats': {'total_players': 10, 'total_teams': 2}}
+
+        result = create_update_results_section(True, True, status, INJURIES, ['A'], [])
+
+        text = json.dumps(_to_json(result), ensure_ascii=False)
+        assert isinstance(result, dbc.ListGroupItem)
+        assert "10 jugadores de 2 equipos" in text
+        assert "3 lesiones de 1 equipos" in text
+
+    def test_defaults_missing_stats_to_zero(self):
+        """Should report zero players and teams when the status has no stats."""
+        result = create_update_results_section(True, False, {}, [], [], [])
+
+        assert "0 jugadores de 0 equipos" in json.dumps(_to_json(result), ensure_ascii=False)
+
+    def test_lists_errors_on_partial_update(self):
+        """Should show the errors when no system was updated."""
+        result = create_update_results_section(False, False, {}, [], [], ['Error en lesiones'])
+
+        assert "Error en lesiones" in json.dumps(_to_json(result), ensure_ascii=False)
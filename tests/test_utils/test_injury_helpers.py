@@ -0,0 +1,174 @@
+# ABOUTME: Tests for the injury dashboard helpers in utils.injury_helpers
+# ABOUTME: Validates statistics, period filtering, table rows and monthly trends
+
+from datetime import date, timedelta
+
+from utils.injury_helpers import (
+    filter_injuries_by_period,
+    calculate_injury_statistics,
+    get_injury_distribution,
+    get_body_parts_distribution,
+    prepare_table_data,
+    get_monthly_trends_data
+)
+
+INJURIES = [
+    {'player_name': 'P1', 'injury_type': 'Muscle', 'body_part': 'Leg', 'status': 'En tratamiento', 'recovery_days': 10},
+    {'player_name': 'P2', 'injury_type': 'Knee', 'body_part': 'Knee', 'status': 'Recuperado', 'recovery_days': 30},
+    {'player_name': 'P3', 'injury_type': 'Muscle', 'body_part': 'Leg', 'status': 'En tratamiento', 'recovery_days': 0},
+    {'player_name': 'P4', 'body_part': 'Leg', 'recovery_days': None},
+    {'player_name': 'P5', 'injury_type': 'Muscle', 'status': 'Recuperado', 'recovery_days': 5},
+]
+
+
+def _days_ago(days: int) -> str:
+    return (date.today() - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+class TestFilterByPeriod:
+    """Tests for filter_injuries_by_period."""
+
+    def test_keeps_injuries_inside_period(self):
+        """Should keep injuries newer than the period cutoff, in order."""
+        injuries = [{'id': 1, 'injury_date': _days_ago(10)}, {'id': 2, 'injury_date': _days_ago(40)},
+                    {'id': 3, 'injury_date': _days_ago(100)}]
+
+        assert [i['id'] for i in filter_injuries_by_period(injuries, '1m')] == [1]
+        assert [i['id'] for i in filter_injuries_by_period(injuries, '3m')] == [1, 2]
+        assert [i['id'] for i in filter_injuries_by_period(injuries, 'season')] == [1, 2, 3]
+
+    def test_keeps_injuries_without_valid_date(self):
+        """Should keep records whose date is missing, empty or unparsable."""
+        injuries = [{'id': 1}, {'id': 2, 'injury_date': ''}, {'id': 3, 'injury_date': None},
+                    {'id': 4, 'injury_date': '15/01/2020'}, {'id': 5, 'injury_date': '2000-01-01'}]
+
+        assert [i['id'] for i in filter_injuries_by_period(injuries, '6m')] == [1, 2, 3, 4]
+
+    def test_unknown_period_uses_three_months(self):
+        """Should fall back to a 90-day window for unknown periods."""
+        injuries = [{'id': 1, 'injury_date': _days_ago(80)}, {'id': 2, 'injury_date': _days_ago(100)}]
+
+        assert [i['id'] for i in filter_injuries_by_period(injuries, 'other')] == [1]
+
+    def test_all_returns_input(self):
+        """Should return the same list for the 'all' period."""
+        injuries = [{'id': 1, 'injury_date': '2000-01-01'}]
+
+        assert filter_injuries_by_period(injuries, 'all') is injuries
+
+
+class TestInjuryStatistics:
+    """Tests for calculate_injury_statistics and the shared tally."""
+
+    def test_counts_totals_and_active(self):
+        """Should count every injury and those still in treatment."""
+        stats = calculate_injury_statistics(INJURIES)
+
+        assert stats['total_injuries'] == 5
+        assert stats['active_injuries'] == 2
+
+    def test_averages_only_known_recovery_days(self):
+        """Should ignore missing and zero recovery days in the average."""
+        stats = calculate_injury_statistics(INJURIES)
+
+        assert stats['avg_recovery_days'] == 15.0
+
+    def test_most_common_type_and_part(self):
+        """Should report the most frequent injury type and body part."""
+        stats = calculate_injury_statistics(INJURIES)
+
+        assert stats['most_common_injury'] == 'Muscle'
+        assert stats['most_affected_part'] == 'Leg'
+
+    def test_empty_list_returns_defaults(self):
+        """Should return zeroed statistics without injuries."""
+        stats = calculate_injury_statistics([])
+
+        assert stats == {
+            'total_injuries': 0,
+            'active_injuries': 0,
+            'avg_recovery_days': 0,
+            'most_common_injury': 'N/A',
+            'most_affected_part': 'N/A'
+        }
+
+    def test_distribution_counts_missing_types(self):
+        """Should count injuries without a type as 'Desconocida'."""
+        types, counts = get_injury_distribution(INJURIES)
+
+        assert types == ['Muscle', 'Knee', 'Desconocida']
+        assert counts == [3, 1, 1]
+
+    def test_body_parts_percentages(self):
+        """Should report each body part with its share of all injuries."""
+        result = get_body_parts_distribution(INJURIES)
+
+        assert result[0] == {'part': 'Leg', 'count': 3, 'percentage': 60.0}
+        assert {'part': 'Otros', 'count': 1, 'percentage': 20.0} in result
+
+
+class TestPrepareTableData:
+    """Tests for prepare_table_data."""
+
+    def test_maps_fields_to_headers(self):
+        """Should return one row per injury keyed by the table headers."""
+        rows = prepare_table_data([{'player_name': 'P1', 'team': 'Eastern', 'injury_date': '2024-01-05'}])
+
+        assert list(rows[0]) == ['Jugador', 'Equipo', 'Tipo', 'Zona', 'Severidad', 'Fecha', 'Días Rec.', 'Estado']
+        assert rows[0]['Jugador'] == 'P1'
+        assert rows[0]['Fecha'] == '2024-01-05'
+
+    def test_missing_fields_take_defaults(self):
+        """Should fill absent fields with the column default."""
+        row = prepare_table_data([{'player_name': 'P1'}])[0]
+
+        assert row['Tipo'] == 'N/A'
+        assert row['Fecha'] == ''
+        assert row['Días Rec.'] == 0
+
+    def test_keeps_explicit_none(self):
+        """Should keep a None value as is, like dict.get with a default."""
+        row = prepare_table_data([{'player_name': 'P1', 'team': None, 'recovery_days': None}])[0]
+
+        assert row['Equipo'] is None
+        assert row['Días Rec.'] is None
+
+    def test_keeps_integer_values(self):
+        """Should not turn integer recovery days into floats."""
+        rows = prepare_table_data([{'recovery_days': 12}, {'player_name': 'P2'}])
+
+        assert rows[0]['Días Rec.'] == 12
+        assert isinstance(rows[0]['Días Rec.'], int)
+
+    def test_empty_input(self):
+        """Should return an empty list when there is no data."""
+        assert prepare_table_data([]) == []
+
+
+class TestMonthlyTrends:
+    """Tests for get_monthly_trends_data."""
+
+    def test_counts_injuries_per_month_in_order(self):
+        """Should return the months in chronological order with their counts."""
+        injuries = [{'injury_date': '2024-03-10'}, {'injury_date': '2023-12-01'},
+                    {'injury_date': '2024-03-28'}, {'injury_date': '2024-01-15'}]
+
+        assert get_monthly_trends_data(injuries) == (['2023-12', '2024-01', '2024-03'], [1, 1, 2])
+
+    def test_ignores_missing_and_invalid_dates(self):
+        """Should skip injuries whose date is absent, empty or unparsable."""
+        injuries = [{'injury_date': '2024-05-02'}, {'injury_date': ''}, {'injury_date': None},
+                    {'injury_date': '02/05/2024'}, {}]
+
+        assert get_monthly_trends_data(injuries) == (['2024-05'], [1])
+
+    def test_without_valid_dates(self):
+        """Should return two empty lists when no date can be used."""
+        assert get_monthly_trends_data([]) == ([], [])
+        assert get_monthly_trends_data([{'injury_date': 'unknown'}]) == ([], [])
+
+    def test_returns_plain_python_values(self):
+        """Should return ints that the charts can serialize."""
+        _, counts = get_monthly_trends_data([{'injury_date': '2024-05-02'}])
+
+        assert type(counts[0]) is int
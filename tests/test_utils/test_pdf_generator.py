@@ -0,0 +1,212 @@
+# ABOUTME: Tests for the PDF report helpers in utils.pdf_generator
+# ABOUTME: Validates shared styles, buffer reuse, cached paragraphs and table rows
+
+import queue
+from io import BytesIO
+
+import pytest
+from reportlab.platypus import Paragraph
+from utils import pdf_generator
+from utils.pdf_generator import (
+    SportsPDFGenerator,
+    release_buffer,
+    _fixed_paragraph,
+    _parsed_frags,
+    _kpi_rows,
+    _ranked_rows,
+    _SCORER_GET,
+    _STYLES
+)
+
+
+@pytest.fixture
+def buffer_pool(monkeypatch):
+    """Empty buffer pool and a fixed report timestamp for byte comparisons."""
+    pool = queue.LifoQueue(maxsize=2)
+    monkeypatch.setattr(pdf_generator, '_BUFFER_POOL', pool)
+    monkeypatch.setattr(pdf_generator, '_report_timestamp', lambda: "01/01/2025 12:00")
+    return pool
+
+
+def _league_data(scorers: int) -> dict:
+    return {
+        'overview': {'total_players': 100, 'total_teams': 10, 'total_goals': 250},
+        'top_performers': {
+            'top_scorers': [{'Player': f'S{i}', 'Team': 'T', 'Goals': 20 - i} for i in range(scorers)],
+        },
+    }
+
+
+def _injury_data(count: int) -> list:
+    return [
+        {'player_name': f'P{i}', 'team': 'T', 'injury_type': 'Knee', 'body_part': 'Leg',
+         'severity': 'Grave', 'injury_date': '2025-01-01', 'status': 'En tratamiento'}
+        for i in range(count)
+    ]
+
+
+class TestSharedStyles:
+    """Tests for the paragraph styles shared by every report."""
+
+    def test_instances_share_class_styles(self):
+        """Should reuse the class-level styles instead of building new ones."""
+        first, second = SportsPDFGenerator(), SportsPDFGenerator(compress=False)
+
+        assert first.title_style is second.title_style is SportsPDFGenerator.title_style
+        assert first.footer_style is second.footer_style
+
+    def test_reports_build_no_styles(self, buffer_pool, monkeypatch):
+        """Should not construct any ParagraphStyle while rendering a report."""
+        built = []
+        monkeypatch.setattr(pdf_generator, 'ParagraphStyle', lambda *args, **kwargs: built.append(args))
+        generator = SportsPDFGenerator()
+
+        generator.create_performance_report(_league_data(5), {'analysis_level': 'league'})
+        generator.create_injury_report(_injury_data(3), {}, {})
+
+        assert built == []
+
+
+class TestBufferPool:
+    """Tests for pooled report buffers and release_buffer."""
+
+    def test_released_buffer_is_reused(self, buffer_pool):
+        """Should hand a released buffer to the next report."""
+        generator = SportsPDFGenerator()
+        first = generator.create_performance_report(_league_data(5), {'analysis_level': 'league'})
+        release_buffer(first)
+
+        second = generator.create_performance_report(_league_data(5), {'analysis_level': 'league'})
+
+        assert second is first
+
+    def test_smaller_report_drops_previous_tail(self, buffer_pool):
+        """Should produce the same bytes as a fresh buffer after a longer report."""
+        generator = SportsPDFGenerator(compress=False)
+        release_buffer(generator.create_injury_report(_injury_data(60), {}, {}))
+
+        reused = generator.create_injury_report(_injury_data(2), {}, {})
+        fresh = generator.create_injury_report(_injury_data(2), {}, {}, out=BytesIO())
+
+        assert reused.tell() == 0
+        assert reused.getvalue() == fresh.getvalue()
+        assert reused.getvalue().rstrip().endswith(b'%%EOF')
+
+    def test_full_pool_discards_buffer(self, buffer_pool):
+        """Should drop released buffers once the pool is full."""
+        for _ in range(3):
+            release_buffer(BytesIO())
+
+        assert buffer_pool.qsize() == 2
+
+    def test_caller_buffer_keeps_position(self, buffer_pool):
+        """Should write into the caller's buffer and leave it at the end of the PDF."""
+        out = BytesIO()
+        result = SportsPDFGenerator().create_injury_report(_injury_data(1), {}, {}, out=out)
+
+        assert result is out
+        assert out.tell() == len(out.getvalue())
+        assert buffer_pool.empty()
+
+
+class TestFixedParagraph:
+    """Tests for paragraphs built from cached fragments."""
+
+    def test_reuses_parsed_fragments(self):
+        """Should parse the markup once per text and style."""
+        style = _STYLES['Normal']
+        _fixed_paragraph("<b>Cached</b> text", style)
+        hits = _parsed_frags.cache_info().hits
+
+        _fixed_paragraph("<b>Cached</b> text", style)
+
+        assert _parsed_frags.cache_info().hits == hits + 1
+
+    def test_paragraphs_do_not_share_fragments(self):
+        """Should give each paragraph its own fragment copies."""
+        style = _STYLES['Normal']
+        first = _fixed_paragraph("<b>Shared</b> text", style)
+        second = _fixed_paragraph("<b>Shared</b> text", style)
+
+        assert all(a is not b for a, b in zip(first.frags, second.frags))
+        assert [f.text for f in first.frags] == [f.text for f in second.frags]
+
+    def test_wrapping_one_copy_leaves_the_other_intact(self):
+        """Should split one paragraph without changing a copy from the cache."""
+        style = _STYLES['Normal']
+        text = " ".join(["word"] * 200)
+        first = _fixed_paragraph(text, style)
+        first.wrap(100, 1000)
+        first.split(100, 50)
+
+        second = _fixed_paragraph(text, style)
+
+        assert second.wrap(400, 1000) == Paragraph(text, style).wrap(400, 1000)
+
+
+class TestKpiRows:
+    """Tests for the KPI rows of each analysis level."""
+
+    def test_league_rows(self):
+        """Should list the league totals under the table header."""
+        rows = _kpi_rows({'total_players': 100, 'total_teams': 10, 'average_age': 25.4}, 'league')
+
+        assert rows[0] == ['Métrica', 'Valor']
+        assert rows[1] == ['Total Players', '100']
+        assert ['Avg. Age', '25.4 años'] in rows
+
+    def test_team_and_player_rows(self):
+        """Should build the rows of the requested level."""
+        team_rows = _kpi_rows({'team_name': 'Eastern'}, 'team')
+        player_rows = _kpi_rows({'name': 'P1', 'age': 24}, 'player')
+
+        assert team_rows[1] == ['Team', 'Eastern']
+        assert player_rows[1] == ['Player', 'P1']
+        assert ['Age', '24 años'] in player_rows
+
+    def test_unknown_level_uses_player_rows(self):
+        """Should fall back to the player rows for any other level."""
+        assert _kpi_rows({'name': 'P1'}, 'other') == _kpi_rows({'name': 'P1'}, 'player')
+
+    def test_missing_values_take_defaults(self):
+        """Should show defaults for values missing from the overview."""
+        rows = _kpi_rows({}, 'team')
+
+        assert rows[1] == ['Team', 'N/A']
+        assert rows[2] == ['Total Players', '0']
+
+    def test_formats_each_value_as_given(self):
+        """Should format equal values of different types as they are."""
+        assert _kpi_rows({'total_players': 1}, 'league')[1] == ['Total Players', '1']
+        assert _kpi_rows({'total_players': 1.0}, 'league')[1] == ['Total Players', '1.0']
+
+
+class TestRankedRows:
+    """Tests for the top scorer and assister rows."""
+
+    def test_builds_position_and_fields(self):
+        """Should number the rows and keep the header first."""
+        rows = _ranked_rows(['Pos.', 'Player', 'Team', 'Goals'],
+                            [{'Player': 'A', 'Team': 'T1', 'Goals': 5}, {'Player': 'B', 'Team': 'T2', 'Goals': 4}],
+                            _SCORER_GET, 'Goals')
+
+        assert rows == [['Pos.', 'Player', 'Team', 'Goals'], ['1', 'A', 'T1', '5'], ['2', 'B', 'T2', '4']]
+
+    def test_fallback_uses_value_key(self):
+        """Should read the ranking value from value_key when a field is missing."""
+        rows = _ranked_rows(['Pos.', 'Player', 'Team', 'Goles'],
+                            [{'Player': 'A', 'Goals': 3}], _SCORER_GET, 'Goals')
+
+        assert rows == [['Pos.', 'Player', 'Team', 'Goles'], ['1', 'A', 'N/A', '3']]
+
+    def test_none_names_are_empty(self):
+        """Should show a None player or team as an empty cell, not 'None'."""
+        rows = _ranked_rows(['Pos.', 'Player', 'Team', 'Goals'],
+                            [{'Player': None, 'Team': 'T1', 'Goals': 2}, {'Player': 'B', 'Team': None, 'Goals': 1}],
+                            _SCORER_GET, 'Goals')
+        fallback = _ranked_rows(['Pos.', 'Player', 'Team', 'Goals'],
+                                [{'Player': None, 'Team': None}], _SCORER_GET, 'Goals')
+
+        assert rows[1] == ['1', '', 'T1', '2']
+        assert rows[2] == ['2', 'B', '', '1']
+        assert fallback[1] == ['1', '', '', '0']
@@ -0,0 +1,135 @@
+# ABOUTME: Tests for the performance dashboard helpers in utils.performance_helpers
+# ABOUTME: Validates analysis titles and the KPI and chart templates of each level
+
+from utils.performance_helpers import (
+    get_analysis_title,
+    create_kpi_structure,
+    get_chart_config,
+    _analysis_title
+)
+
+
+class TestAnalysisTitle:
+    """Tests for get_analysis_title."""
+
+    def test_league_title_with_filters(self):
+        """Should add the position and a non-default age range to the league title."""
+        filters = {'analysis_level': 'league', 'season': '2024-25',
+                   'position_filter': 'Forward', 'age_range': [18, 30]}
+
+        assert get_analysis_title(filters, {}) == "Liga de Hong Kong - 2024-25 (Pos: Forward, Edad: 18-30)"
+        assert get_analysis_title({'season': '2024-25', 'age_range': [15, 45]}, {}) == \
+            "Liga de Hong Kong - 2024-25"
+
+    def test_team_and_player_titles(self):
+        """Should name the team or player, and only report data that matches the level."""
+        team_filters = {'analysis_level': 'team', 'season': '2024-25', 'position_filter': 'all'}
+        player_filters = {'analysis_level': 'player', 'season': '2024-25', 'position_filter': 'Forward'}
+
+        assert get_analysis_title(team_filters, {'overview': {'team_name': 'Eastern'}}) == "Eastern - 2024-25"
+        assert get_analysis_title(player_filters, {'basic_info': {'name': 'P1'}}) == "P1 - 2024-25"
+        assert get_analysis_title(player_filters, {'overview': {}}) == "Datos no disponibles"
+
+    def test_none_name_is_kept(self):
+        """Should show a None team or player name instead of the unavailable message."""
+        filters = {'analysis_level': 'team', 'season': '2024-25'}
+
+        assert get_analysis_title(filters, {'overview': {'team_name': None}}) == "None - 2024-25"
+
+    def test_unhashable_filters_skip_cache(self):
+        """Should build the title without the cache when a filter value is unhashable."""
+        filters = {'analysis_level': 'league', 'season': ['2023-24', '2024-25'], 'position_filter': {'a': 1}}
+
+        assert get_analysis_title(filters, {}) == "Liga de Hong Kong - ['2023-24', '2024-25'] (Pos: {'a': 1})"
+
+    def test_repeated_filters_hit_cache(self):
+        """Should answer repeated filters from the cache, keeping value types apart."""
+        _analysis_title.cache_clear()
+        for _ in range(3):
+            get_analysis_title({'season': '2024-25'}, {})
+
+        assert _analysis_title.cache_info().hits == 2
+        assert get_analysis_title({'season': 2024}, {}) == "Liga de Hong Kong - 2024"
+        assert get_analysis_title({'season': 2024.0}, {}) == "Liga de Hong Kong - 2024.0"
+
+
+class TestKpiStructure:
+    """Tests for create_kpi_structure."""
+
+    def test_league_kpis(self):
+        """Should list the league KPIs in order with a width of 2."""
+        kpis = create_kpi_structure('league', {'overview': {'total_players': 120, 'average_age': 25.5}})
+
+        assert [k['label'] for k in kpis] == ['Jugadores', 'Equipos', 'Goles Totales', 'Asistencias',
+                                             'Edad Promedio', 'Goles/Jugador']
+        assert kpis[0] == {'value': 120, 'label': 'Jugadores', 'color': 'primary', 'md': 2}
+        assert kpis[4]['value'] == '25.5'
+        assert kpis[5]['value'] == '0'
+
+    def test_team_kpis(self):
+        """Should build four team KPIs with a width of 3."""
+        kpis = create_kpi_structure('team', {'overview': {'total_goals': 30, 'avg_age': 24}})
+
+        assert len(kpis) == 4
+        assert {k['md'] for k in kpis} == {3}
+        assert kpis[1]['value'] == 30
+        assert kpis[3]['value'] == '24'
+
+    def test_player_kpis_read_both_sources(self):
+        """Should combine basic info and performance stats for a player."""
+        data = {
+            'basic_info': {'age': 27, 'position_group': 'Forward'},
+            'performance_stats': {'goals': 8, 'minutes_per_match': 78.6}
+        }
+
+        values = {k['label']: k['value'] for k in create_kpi_structure('player', data)}
+
+        assert values == {'Edad': 27, 'Partidos': 0, 'Goles': 8, 'Asistencias': 0,
+                          'Posición': 'Forward', 'Min/Partido': '79'}
+
+    def test_player_without_performance_stats(self):
+        """Should use defaults when a player has no performance stats."""
+        kpis = create_kpi_structure('player', {'basic_info': {}})
+
+        assert kpis[0]['value'] == 'N/A'
+        assert kpis[-1]['value'] == '0'
+
+    def test_missing_data_or_unknown_level(self):
+        """Should return no KPIs when the level's data is missing or the level is unknown."""
+        assert create_kpi_structure('team', {'basic_info': {}}) == []
+        assert create_kpi_structure('player', {'overview': {}}) == []
+        assert create_kpi_structure('season', {'overview': {}}) == []
+
+
+class TestChartConfig:
+    """Tests for get_chart_config."""
+
+    def test_bar_config(self):
+        """Should merge the title into the bar chart template."""
+        assert get_chart_config('bar', {}, 'Goles') == {
+            'title': 'Goles', 'height': 400, 'showlegend': False,
+            'color_continuous_scale': 'Blues', 'labels': {'x': 'Elementos', 'y': 'Valores'}
+        }
+
+    def test_scatter_and_pie_config(self):
+        """Should use the scatter template and the base settings for pies."""
+        scatter = get_chart_config('scatter', {}, 'Edad vs Goles')
+
+        assert scatter['labels'] == {'x': 'X', 'y': 'Y'}
+        assert scatter['hover_name'] == 'Elemento'
+        assert get_chart_config('pie', {}, 'Posiciones') == {'title': 'Posiciones', 'height': 400, 'showlegend': False}
+
+    def test_unknown_type_uses_base_settings(self):
+        """Should return the base settings for any other chart type."""
+        assert get_chart_config('line', {}, 'T') == {'title': 'T', 'height': 400, 'showlegend': False}
+
+    def test_returned_config_does_not_change_templates(self):
+        """Should return a new dict whose labels can be edited safely."""
+        first = get_chart_config('bar', {}, 'A')
+        first['labels']['x'] = 'Jugadores'
+        first['height'] = 600
+
+        second = get_chart_config('bar', {}, 'B')
+
+        assert second['labels'] == {'x': 'Elementos', 'y': 'Valores'}
+        assert second['height'] == 400
@@ -5,10 +5,12 @@ from typing import Any, Dict, Union, List
 import dash_bootstrap_components as dbc
 from dash import html
 from datetime import datetime
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=512)
 def format_season_short(season):
     """
     Convierte formato de temporada de '2024-25' a '24/25'.
@@ -40,12 +42,17 @@ def format_datetime(dt):
     Returns:
         str: Fecha formateada o 'Nunca'
     """
-    if dt is None:
+    if not isinstance(dt, (datetime, str)):
         return 'Nunca'
     
+    return _format_datetime_cached(dt)
+
+@lru_cache(maxsize=512)
+def _format_datetime_cached(dt):
+    """Implementación memoizada de format_datetime (solo datetime o str)."""
     if isinstance(dt, datetime):
         return dt.strftime("%Y-%m-%d %H:%M:%S")
-    elif isinstance(dt, str) and dt not in ['None', 'null', '{}']:
+    elif dt not in ['None', 'null', '{}']:
         try:
             # Intentar parsear si es string ISO
             parsed_dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
@@ -80,6 +87,19 @@ def safe_get_analysis_level(filters, default='league'):
     validated_filters = validate_filters(filters, default)
     return validated_filters.get('analysis_level', default)
 
+def validate_filters_with_level(filters, default_analysis_level='league'):
+    """
+    Valida los filtros y devuelve también su analysis_level.
+    
+    Equivale a validate_filters seguido de safe_get_analysis_level, pero
+    validando una sola vez.
+    
+    Returns:
+        Tupla (filtros validados, analysis_level)
+    """
+    validated_filters = validate_filters(filters, default_analysis_level)
+    return validated_filters, validated_filters.get('analysis_level', default_analysis_level)
+
 def validate_data(data: Any, data_name: str = "datos") -> bool:
     """
     Valida que los datos no estén vacíos o sean None.
@@ -1,12 +1,151 @@
 # ABOUTME: This module provides classes for calculating efficiency metrics and percentile rankings.
 # ABOUTME: It includes EfficiencyMetricsCalculator and PercentileRankingSystem for advanced player analysis.
 
+import sys
+from collections import OrderedDict
+from functools import cached_property
+import numpy as np
 import pandas as pd
 from typing import Dict, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns read as numbers by the calculators; coerced once at construction
+NUMERIC_COLS = frozenset({
+    'Goals', 'xG', 'Assists', 'xA', 'Shots', 'Shots on target, %',
+    'Tackles per 90', 'Interceptions per 90', 'Defensive duels won, %',
+    'Accurate passes, %', 'Passes per 90', 'Duels won, %', 'Matches played'
+})
+
+# Columns summarized by EfficiencyMetricsCalculator.get_efficiency_profile
+PROFILE_COLS = frozenset({
+    'Goals', 'xG', 'Assists', 'xA', 'Shots', 'Shots on target, %',
+    'Tackles per 90', 'Interceptions per 90', 'Defensive duels won, %',
+    'Accurate passes, %'
+})
+
+# Team-level aggregates ranked by get_team_percentiles: name -> (column, aggregation)
+TEAM_PERCENTILE_METRICS = {
+    'total_goals': ('Goals', 'sum'),
+    'total_assists': ('Assists', 'sum'),
+    'avg_pass_accuracy': ('Accurate passes, %', 'mean'),
+    'total_tackles': ('Tackles per 90', 'sum'),
+    'total_interceptions': ('Interceptions per 90', 'sum'),
+}
+
+# Cut points reported by the percentile distributions
+PERCENTILE_LEVELS = (10, 25, 50, 75, 90)
+
+# Default number of entries kept in PercentileRankingSystem's percentile cache
+PERCENTILE_CACHE_MAXSIZE = 1024
+
+# Size of a boxed Python float, used for cache size estimates
+FLOAT_SIZE = sys.getsizeof(0.0)
+
+# Storage type for percentile/ranking columns; float64 keeps percentiles identical to pandas
+RANKING_DTYPE = np.float64
+
+
+def _numeric_view(data: pd.DataFrame, fill_value: float = None,
+                  dtype=None) -> pd.DataFrame:
+    """Copy of data with NUMERIC_COLS coerced to numbers (NaN optionally filled)."""
+    numeric = data.copy()
+    cols = list(data.columns.intersection(NUMERIC_COLS))
+    if cols:
+        numeric[cols] = data[cols].apply(pd.to_numeric, errors='coerce')
+        if fill_value is not None:
+            numeric[cols] = numeric[cols].fillna(fill_value)
+        if dtype is not None:
+            numeric[cols] = numeric[cols].astype(dtype)
+    return numeric
+
+
+def _coerce(values: pd.Series, fill_value: float = None, dtype=None) -> pd.Series:
+    """values coerced to numbers (NaN optionally filled), as _numeric_view does per column."""
+    numeric = pd.to_numeric(values, errors='coerce')
+    if fill_value is not None:
+        numeric = numeric.fillna(fill_value)
+    if dtype is not None:
+        numeric = numeric.astype(dtype)
+    return numeric
+
+
+def _index_by(data: pd.DataFrame, column: str, sort: bool = False) -> pd.DataFrame:
+    """View of data indexed by column (kept as a column too) for label lookups."""
+    if column not in data.columns:
+        return data.iloc[0:0]
+    indexed = data.set_index(column, drop=False).rename_axis(None)
+    if not sort:
+        return indexed
+    # Sorted views drop unlabeled rows so each label maps to one contiguous slice
+    return indexed[indexed.index.notna()].sort_index(kind='mergesort')
+
+
+def _column_values(data: pd.DataFrame, column: str, default) -> np.ndarray:
+    """Column as an ndarray, or default repeated when the column is missing."""
+    if column in data.columns:
+        return data[column].to_numpy()
+    return np.full(len(data), default, dtype=object)
+
+
+def _identifier_sets(data: pd.DataFrame):
+    """Known players, teams and positions, for membership checks without a mask."""
+    def known(column):
+        return frozenset(data[column].unique()) if column in data.columns else frozenset()
+
+    return known('Player'), known('Team'), known('Position_Group')
+
+
+def _percentile_cut_points(values: np.ndarray) -> Dict[str, float]:
+    """All PERCENTILE_LEVELS of values from a single np.percentile call."""
+    return _label_cut_points(np.percentile(values, PERCENTILE_LEVELS))
+
+
+def _label_cut_points(cut_points) -> Dict[str, float]:
+    """Key cut points computed at PERCENTILE_LEVELS as '10th', '25th', ..."""
+    return {f"{level}th": float(value) for level, value in zip(PERCENTILE_LEVELS, cut_points)}
+
+
+def _outlier_mask(values: np.ndarray, std_threshold: float) -> np.ndarray:
+    """Boolean mask of values whose z-score magnitude exceeds std_threshold."""
+    if len(values) < 2:
+        return np.zeros(len(values), dtype=bool)
+
+    mean_value = values.mean()
+    std_value = values.std(ddof=1)
+
+    if std_value == 0:
+        return np.zeros(len(values), dtype=bool)
+
+    z_scores = (values - mean_value) / std_value
+    return np.abs(z_scores) > std_threshold
+
+
+def _top_n_order(values: np.ndarray, top_n: int):
+    """
+    Positions of the top_n largest non-NaN values, best first.
+    Returns: (positions, number of non-NaN values)
+    """
+    valid_positions = np.flatnonzero(~np.isnan(values))
+    valid_values = values[valid_positions]
+    top_n = min(top_n, len(valid_values))
+
+    if top_n <= 0:
+        return valid_positions[:0], len(valid_values)
+
+    # Stable descending sort: ties, including those at the cutoff, keep row order
+    top = np.argsort(-valid_values, kind='stable')[:top_n]
+    return valid_positions[top], len(valid_values)
+
+
+def _cache_entry_size(key: tuple, entry: Dict) -> int:
+    """Approximate bytes held by one percentile cache entry (key, sorted array, cut points)."""
+    quantiles = entry['quantiles']
+    return (sys.getsizeof(key) + sys.getsizeof(entry) + entry['sorted'].nbytes
+            + sys.getsizeof(quantiles) + FLOAT_SIZE * len(quantiles))
+
+
 class EfficiencyMetricsCalculator:
     """
     Calculate efficiency ratios and comparative metrics.
@@ -19,6 +158,9 @@ class EfficiencyMetricsCalculator:
             processed_data: Full season DataFrame
         """
         self.data = processed_data
+        self._numeric_cols = frozenset(processed_data.columns.intersection(NUMERIC_COLS))
+        self._coerced = {}  # metric outside NUMERIC_COLS -> league-wide coerced values
+        self._player_set, self._team_set, self._position_set = _identifier_sets(processed_data)
 
     # Offensive Efficiency
     def calculate_goals_xg_ratio(self, group_by: str = None) -> Dict:
@@ -32,21 +174,11 @@ class EfficiencyMetricsCalculator:
         grouped_data = self._group_data(group_by)
 
         for group_name, group_data in grouped_data:
-            goals = pd.to_numeric(group_data.get('Goals', 0), errors='coerce').fillna(0).sum()
-            xg = pd.to_numeric(group_data.get('xG', 0), errors='coerce').fillna(0).sum()
-
-            if xg > 0:
-                ratio = goals / xg
-            else:
-                ratio = 0 if goals == 0 else float('inf')
-
-            results[group_name] = {
-                'goals': float(goals),
-                'xG': float(xg),
-                'ratio': round(ratio, 3),
-                'interpretation': self._interpret_xg_ratio(ratio),
-                'sample_size': len(group_data)
-            }
+            results[group_name] = self._goals_xg_entry(
+                group_data.get('Goals', 0).sum(),
+                group_data.get('xG', 0).sum(),
+                len(group_data)
+            )
 
         return results
 
@@ -60,21 +192,11 @@ class EfficiencyMetricsCalculator:
         grouped_data = self._group_data(group_by)
 
         for group_name, group_data in grouped_data:
-            assists = pd.to_numeric(group_data.get('Assists', 0), errors='coerce').fillna(0).sum()
-            xa = pd.to_numeric(group_data.get('xA', 0), errors='coerce').fillna(0).sum()
-
-            if xa > 0:
-                ratio = assists / xa
-            else:
-                ratio = 0 if assists == 0 else float('inf')
-
-            results[group_name] = {
-                'assists': float(assists),
-                'xA': float(xa),
-                'ratio': round(ratio, 3),
-                'interpretation': self._interpret_xa_ratio(ratio),
-                'sample_size': len(group_data)
-            }
+            results[group_name] = self._assists_xa_entry(
+                group_data.get('Assists', 0).sum(),
+                group_data.get('xA', 0).sum(),
+                len(group_data)
+            )
 
         return results
 
@@ -89,20 +211,12 @@ class EfficiencyMetricsCalculator:
         grouped_data = self._group_data(group_by)
 
         for group_name, group_data in grouped_data:
-            tackles = pd.to_numeric(group_data.get('Tackles per 90', 0), errors='coerce').fillna(0).sum()
-            interceptions = pd.to_numeric(group_data.get('Interceptions per 90', 0), errors='coerce').fillna(0).sum()
-            duels_won_pct = pd.to_numeric(group_data.get('Defensive duels won, %', 0), errors='coerce').fillna(0).mean()
-
-            total_defensive_actions = tackles + interceptions
-            success_rate = duels_won_pct  # Using duels won % as proxy for success rate
-
-            results[group_name] = {
-                'total_defensive_actions': round(total_defensive_actions, 2),
-                'success_rate_percentage': round(success_rate, 2),
-                'tackles_per_90': round(tackles / len(group_data) if len(group_data) > 0 else 0, 2),
-                'interceptions_per_90': round(interceptions / len(group_data) if len(group_data) > 0 else 0, 2),
-                'sample_size': len(group_data)
-            }
+            results[group_name] = self._defensive_entry(
+                group_data.get('Tackles per 90', 0).sum(),
+                group_data.get('Interceptions per 90', 0).sum(),
+                group_data.get('Defensive duels won, %', 0).mean(),
+                len(group_data)
+            )
 
         return results
 
@@ -117,20 +231,11 @@ class EfficiencyMetricsCalculator:
         grouped_data = self._group_data(group_by)
 
         for group_name, group_data in grouped_data:
-            total_shots = pd.to_numeric(group_data.get('Shots', 0), errors='coerce').fillna(0).sum()
-            shots_on_target_pct = pd.to_numeric(group_data.get('Shots on target, %', 0), errors='coerce').fillna(0).mean()
-
-            # Calculate shots on target from percentage
-            shots_on_target = (total_shots * shots_on_target_pct) / 100 if total_shots > 0 else 0
-
-            accuracy = shots_on_target_pct if total_shots > 0 else 0
-
-            results[group_name] = {
-                'total_shots': float(total_shots),
-                'shots_on_target': round(shots_on_target, 2),
-                'accuracy_percentage': round(accuracy, 2),
-                'sample_size': len(group_data)
-            }
+            results[group_name] = self._shot_accuracy_entry(
+                group_data.get('Shots', 0).sum(),
+                group_data.get('Shots on target, %', 0).mean(),
+                len(group_data)
+            )
 
         return results
 
@@ -144,18 +249,11 @@ class EfficiencyMetricsCalculator:
         grouped_data = self._group_data(group_by)
 
         for group_name, group_data in grouped_data:
-            total_shots = pd.to_numeric(group_data.get('Shots', 0), errors='coerce').fillna(0).sum()
-            total_xg = pd.to_numeric(group_data.get('xG', 0), errors='coerce').fillna(0).sum()
-
-            xg_per_shot = (total_xg / total_shots) if total_shots > 0 else 0
-
-            results[group_name] = {
-                'total_shots': float(total_shots),
-                'total_xG': float(total_xg),
-                'xG_per_shot': round(xg_per_shot, 3),
-                'interpretation': self._interpret_xg_per_shot(xg_per_shot),
-                'sample_size': len(group_data)
-            }
+            results[group_name] = self._xg_per_shot_entry(
+                group_data.get('Shots', 0).sum(),
+                group_data.get('xG', 0).sum(),
+                len(group_data)
+            )
 
         return results
 
@@ -171,18 +269,11 @@ class EfficiencyMetricsCalculator:
         grouped_data = self._group_data(group_by)
 
         for group_name, group_data in grouped_data:
-            pass_accuracy = pd.to_numeric(group_data.get('Accurate passes, %', 0), errors='coerce').fillna(0).mean()
-            interceptions_conceded = pd.to_numeric(group_data.get('Interceptions per 90', 0), errors='coerce').fillna(0).mean()
-
-            # Lower interception rate + higher pass accuracy = better under pressure
-            under_pressure_score = pass_accuracy - (interceptions_conceded * 2)  # Penalize interceptions
-
-            results[group_name] = {
-                'pass_accuracy': round(pass_accuracy, 2),
-                'interceptions_per_90': round(interceptions_conceded, 2),
-                'under_pressure_score': round(under_pressure_score, 2),
-                'sample_size': len(group_data)
-            }
+            results[group_name] = self._pass_pressure_entry(
+                group_data.get('Accurate passes, %', 0).mean(),
+                group_data.get('Interceptions per 90', 0).mean(),
+                len(group_data)
+            )
 
         return results
 
@@ -192,39 +283,54 @@ class EfficiencyMetricsCalculator:
         """Comprehensive efficiency report for entity."""
         # Filter data based on level
         if level == 'player':
-            filtered_data = self.data[self.data['Player'] == identifier]
-            if filtered_data.empty:
+            if identifier not in self._player_set:
                 logger.warning(f"Player '{identifier}' not found")
                 return {}
+            filtered_data = self._by_player.loc[[identifier]]
             profile_id = identifier
         elif level == 'team':
-            filtered_data = self.data[self.data['Team'] == identifier]
-            if filtered_data.empty:
+            if identifier not in self._team_set:
                 logger.warning(f"Team '{identifier}' not found")
                 return {}
+            filtered_data = self._num[self._num['Team'] == identifier]
             profile_id = identifier
         elif level == 'position':
-            filtered_data = self.data[self.data.get('Position_Group', '') == identifier]
-            if filtered_data.empty:
+            if identifier not in self._position_set:
                 logger.warning(f"Position '{identifier}' not found")
                 return {}
+            filtered_data = self._by_pos.loc[[identifier]]
             profile_id = identifier
         else:
             logger.error(f"Invalid level: {level}")
             return {}
 
-        # Create temporary calculator with filtered data
-        temp_calc = EfficiencyMetricsCalculator(filtered_data)
+        # Sums and means of every profile column in a single pass
+        columns = list(filtered_data.columns.intersection(PROFILE_COLS))
+        stats = filtered_data[columns].agg(['sum', 'mean'])
+        sample_size = len(filtered_data)
+
+        def total(column):
+            return stats.at['sum', column] if column in stats.columns else 0
+
+        def average(column):
+            return stats.at['mean', column] if column in stats.columns else 0
 
         profile = {
             'identifier': profile_id,
             'level': level,
-            'goals_xg_ratio': temp_calc.calculate_goals_xg_ratio(),
-            'assists_xa_ratio': temp_calc.calculate_assists_xa_ratio(),
-            'shot_accuracy': temp_calc.calculate_shot_accuracy(),
-            'xg_per_shot': temp_calc.calculate_xg_per_shot(),
-            'defensive_efficiency': temp_calc.calculate_defensive_efficiency(),
-            'pass_under_pressure': temp_calc.calculate_pass_completion_under_pressure()
+            'goals_xg_ratio': {'league': self._goals_xg_entry(
+                total('Goals'), total('xG'), sample_size)},
+            'assists_xa_ratio': {'league': self._assists_xa_entry(
+                total('Assists'), total('xA'), sample_size)},
+            'shot_accuracy': {'league': self._shot_accuracy_entry(
+                total('Shots'), average('Shots on target, %'), sample_size)},
+            'xg_per_shot': {'league': self._xg_per_shot_entry(
+                total('Shots'), total('xG'), sample_size)},
+            'defensive_efficiency': {'league': self._defensive_entry(
+                total('Tackles per 90'), total('Interceptions per 90'),
+                average('Defensive duels won, %'), sample_size)},
+            'pass_under_pressure': {'league': self._pass_pressure_entry(
+                average('Accurate passes, %'), average('Interceptions per 90'), sample_size)}
         }
 
         return profile
@@ -232,11 +338,10 @@ class EfficiencyMetricsCalculator:
     def compare_to_benchmarks(self, identifier: str,
                              metric: str) -> Dict:
         """Compare player/team to position/league benchmarks."""
-        player_data = self.data[self.data['Player'] == identifier]
-
-        if player_data.empty:
+        if identifier not in self._player_set:
             logger.warning(f"Player '{identifier}' not found")
             return {}
+        player_data = self._by_player.loc[[identifier]]
 
         position = player_data['Position_Group'].iloc[0] if 'Position_Group' in player_data.columns else None
 
@@ -244,16 +349,18 @@ class EfficiencyMetricsCalculator:
             return {}
 
         # Get player metric value
-        player_value = pd.to_numeric(player_data.get(metric, 0), errors='coerce').fillna(0).iloc[0]
+        player_value = self._metric_values(player_data, metric).iloc[0]
 
         # Get position benchmark
-        position_data = self.data[self.data.get('Position_Group', '') == position]
-        position_mean = pd.to_numeric(position_data.get(metric, 0), errors='coerce').fillna(0).mean()
-        position_std = pd.to_numeric(position_data.get(metric, 0), errors='coerce').fillna(0).std()
+        position_data = self._by_pos.loc[[position]]
+        position_values = self._metric_values(position_data, metric)
+        position_mean = position_values.mean()
+        position_std = position_values.std()
 
         # Get league benchmark
-        league_mean = pd.to_numeric(self.data.get(metric, 0), errors='coerce').fillna(0).mean()
-        league_std = pd.to_numeric(self.data.get(metric, 0), errors='coerce').fillna(0).std()
+        league_values = self._league_values(metric)
+        league_mean = league_values.mean()
+        league_std = league_values.std()
 
         # Calculate z-scores
         position_zscore = (player_value - position_mean) / position_std if position_std > 0 else 0
@@ -279,38 +386,150 @@ class EfficiencyMetricsCalculator:
     def detect_efficiency_outliers(self, metric: str,
                                    std_threshold: float = 2.0) -> List[str]:
         """Identify players with unusual efficiency patterns."""
-        metric_values = pd.to_numeric(self.data.get(metric, 0), errors='coerce').fillna(0)
-
-        mean_value = metric_values.mean()
-        std_value = metric_values.std()
-
-        if std_value == 0:
+        if metric not in self.data.columns:
+            logger.warning(f"Metric '{metric}' not available")
             return []
 
-        # Calculate z-scores
-        z_scores = (metric_values - mean_value) / std_value
-
         # Find outliers (beyond threshold standard deviations)
-        outlier_indices = self.data[abs(z_scores) > std_threshold].index.tolist()
+        mask = _outlier_mask(self._league_values(metric).to_numpy(dtype=np.float64), std_threshold)
 
-        outliers = []
-        for idx in outlier_indices:
-            player_name = self.data.loc[idx, 'Player'] if 'Player' in self.data.columns else f"Player_{idx}"
-            outliers.append(player_name)
-
-        return outliers
+        if 'Player' in self.data.columns:
+            return self.data['Player'].to_numpy()[mask].tolist()
+        return [f"Player_{idx}" for idx in self.data.index[mask]]
 
     # Helper Methods
     def _group_data(self, group_by: str = None):
         """Helper to group data by specified column."""
         if group_by == 'position':
-            return self.data.groupby('Position_Group')
+            return self._num.groupby('Position_Group')
         elif group_by == 'team':
-            return self.data.groupby('Team')
+            return self._num.groupby('Team')
         elif group_by == 'player':
-            return self.data.groupby('Player')
+            return self._num.groupby('Player')
         else:
-            return [('league', self.data)]
+            return [('league', self._num)]
+
+    def _metric_values(self, frame: pd.DataFrame, metric: str) -> pd.Series:
+        """
+        metric of frame (the numeric view or a slice of it) as numbers, 0 if missing.
+        Columns outside NUMERIC_COLS are coerced on a copy; the views are never modified.
+        """
+        if metric in self._numeric_cols:
+            return frame[metric]
+        if metric not in frame.columns:
+            return pd.Series(0, index=frame.index, dtype=np.float64)
+        return _coerce(frame[metric], fill_value=0)
+
+    def _league_values(self, metric: str) -> pd.Series:
+        """League-wide metric as numbers; coerced columns are kept per metric."""
+        values = self._coerced.get(metric)
+        if values is None:
+            values = self._metric_values(self._num, metric)
+            if metric not in self._numeric_cols:
+                self._coerced[metric] = values
+        return values
+
+    # Views built on first use, so constructing the calculator copies nothing
+    @cached_property
+    def _num(self) -> pd.DataFrame:
+        """Copy of the data with NUMERIC_COLS coerced to numbers."""
+        return _numeric_view(self.data, fill_value=0)
+
+    @cached_property
+    def _by_player(self) -> pd.DataFrame:
+        """Numeric view indexed by player for direct lookups."""
+        return _index_by(self._num, 'Player')
+
+    @cached_property
+    def _by_pos(self) -> pd.DataFrame:
+        """Numeric view sorted by position, one contiguous slice per position."""
+        return _index_by(self._num, 'Position_Group', sort=True)
+
+    # Entry Builders (shared by the calculate_* methods and profiles)
+    def _goals_xg_entry(self, goals: float, xg: float, sample_size: int) -> Dict:
+        """Goals/xG entry for one group."""
+        if xg > 0:
+            ratio = goals / xg
+        else:
+            ratio = 0 if goals == 0 else float('inf')
+
+        return {
+            'goals': float(goals),
+            'xG': float(xg),
+            'ratio': round(ratio, 3),
+            'interpretation': self._interpret_xg_ratio(ratio),
+            'sample_size': sample_size
+        }
+
+    def _assists_xa_entry(self, assists: float, xa: float, sample_size: int) -> Dict:
+        """Assists/xA entry for one group."""
+        if xa > 0:
+            ratio = assists / xa
+        else:
+            ratio = 0 if assists == 0 else float('inf')
+
+        return {
+            'assists': float(assists),
+            'xA': float(xa),
+            'ratio': round(ratio, 3),
+            'interpretation': self._interpret_xa_ratio(ratio),
+            'sample_size': sample_size
+        }
+
+    def _defensive_entry(self, tackles: float, interceptions: float,
+                         duels_won_pct: float, sample_size: int) -> Dict:
+        """Defensive efficiency entry for one group."""
+        total_defensive_actions = tackles + interceptions
+        success_rate = duels_won_pct  # Using duels won % as proxy for success rate
+
+        return {
+            'total_defensive_actions': round(total_defensive_actions, 2),
+            'success_rate_percentage': round(success_rate, 2),
+            'tackles_per_90': round(tackles / sample_size if sample_size > 0 else 0, 2),
+            'interceptions_per_90': round(interceptions / sample_size if sample_size > 0 else 0, 2),
+            'sample_size': sample_size
+        }
+
+    def _shot_accuracy_entry(self, total_shots: float, shots_on_target_pct: float,
+                             sample_size: int) -> Dict:
+        """Shot accuracy entry for one group."""
+        # Calculate shots on target from percentage
+        shots_on_target = (total_shots * shots_on_target_pct) / 100 if total_shots > 0 else 0
+
+        accuracy = shots_on_target_pct if total_shots > 0 else 0
+
+        return {
+            'total_shots': float(total_shots),
+            'shots_on_target': round(shots_on_target, 2),
+            'accuracy_percentage': round(accuracy, 2),
+            'sample_size': sample_size
+        }
+
+    def _xg_per_shot_entry(self, total_shots: float, total_xg: float,
+                           sample_size: int) -> Dict:
+        """xG per shot entry for one group."""
+        xg_per_shot = (total_xg / total_shots) if total_shots > 0 else 0
+
+        return {
+            'total_shots': float(total_shots),
+            'total_xG': float(total_xg),
+            'xG_per_shot': round(xg_per_shot, 3),
+            'interpretation': self._interpret_xg_per_shot(xg_per_shot),
+            'sample_size': sample_size
+        }
+
+    def _pass_pressure_entry(self, pass_accuracy: float, interceptions_conceded: float,
+                             sample_size: int) -> Dict:
+        """Pass completion under pressure entry for one group."""
+        # Lower interception rate + higher pass accuracy = better under pressure
+        under_pressure_score = pass_accuracy - (interceptions_conceded * 2)  # Penalize interceptions
+
+        return {
+            'pass_accuracy': round(pass_accuracy, 2),
+            'interceptions_per_90': round(interceptions_conceded, 2),
+            'under_pressure_score': round(under_pressure_score, 2),
+            'sample_size': sample_size
+        }
 
     def _interpret_xg_ratio(self, ratio: float) -> str:
         """Interpret goals/xG ratio."""
@@ -351,14 +570,24 @@ class PercentileRankingSystem:
     Optimized with aggressive caching for expensive calculations.
     """
 
-    def __init__(self, processed_data: pd.DataFrame):
+    def __init__(self, processed_data: pd.DataFrame,
+                 cache_maxsize: int = PERCENTILE_CACHE_MAXSIZE):
         """
         Args:
             processed_data: Full season DataFrame
+            cache_maxsize: Percentile cache entries kept before evicting the oldest
         """
         self.data = processed_data
-        self._percentile_cache = {}
+        self._numeric_cols = frozenset(processed_data.columns.intersection(NUMERIC_COLS))
+        self._coerced = {}  # metric outside NUMERIC_COLS -> league-wide coerced values
+        self._player_set, self._team_set, self._position_set = _identifier_sets(processed_data)
+        # (position, or None for league, metric) -> {'sorted': ndarray, 'quantiles': cut points}
+        self._percentile_cache = OrderedDict()
+        self._cache_maxsize = cache_maxsize
         self._ranking_cache = {}
+        self._percentile_cache_bytes = 0  # Running payload estimate, see _cache_set
+        self._ranking_cache_bytes = 0
+        self._team_aggregates = None
 
     # Core Percentile Methods
     def get_player_percentiles(self, player_name: str,
@@ -367,11 +596,10 @@ class PercentileRankingSystem:
         Get percentile rankings for player across key metrics.
         by_position: Compare vs same position (True) or all players (False)
         """
-        player_data = self.data[self.data['Player'] == player_name]
-
-        if player_data.empty:
+        if player_name not in self._player_set:
             logger.warning(f"Player '{player_name}' not found")
             return {}
+        player_data = self._by_player.loc[[player_name]]
 
         position = player_data['Position_Group'].iloc[0] if 'Position_Group' in player_data.columns else None
 
@@ -383,27 +611,25 @@ class PercentileRankingSystem:
             'Duels won, %', 'Defensive duels won, %'
         ]
 
-        # Filter comparison data
-        if by_position and position:
-            comparison_data = self.data[self.data.get('Position_Group', '') == position]
-        else:
-            comparison_data = self.data
+        # Comparison group: same position or whole league
+        comparison_position = position if by_position and position else None
 
         percentiles = {}
 
         for metric in key_metrics:
-            if metric not in player_data.columns or metric not in comparison_data.columns:
+            if metric not in player_data.columns:
                 continue
 
-            player_value = pd.to_numeric(player_data[metric].iloc[0], errors='coerce')
+            player_value = player_data[metric].iloc[0]
             if pd.isna(player_value):
                 continue
 
             # Calculate percentile rank
-            metric_values = pd.to_numeric(comparison_data[metric], errors='coerce').dropna()
+            metric_values = self._position_array(comparison_position, metric)
 
             if len(metric_values) > 0:
-                percentile = (metric_values < player_value).sum() / len(metric_values) * 100
+                below = np.searchsorted(metric_values, player_value, side='left')
+                percentile = below / len(metric_values) * 100
                 percentiles[metric] = {
                     'value': round(float(player_value), 3),
                     'percentile': round(float(percentile), 2),
@@ -424,28 +650,23 @@ class PercentileRankingSystem:
         Get percentile distribution for metric within position.
         Returns: {10th: val, 25th: val, 50th: val, 75th: val, 90th: val}
         """
-        position_data = self.data[self.data.get('Position_Group', '') == position]
-
-        if position_data.empty or metric not in position_data.columns:
+        if position not in self._position_set or metric not in self.data.columns:
             logger.warning(f"Position '{position}' not found or metric '{metric}' not available")
             return {}
 
-        metric_values = pd.to_numeric(position_data[metric], errors='coerce').dropna()
+        entry = self._percentile_entry(position, metric)
+        metric_values = entry['sorted']
 
         if len(metric_values) == 0:
             return {}
 
-        percentiles = {
-            '10th': round(float(metric_values.quantile(0.10)), 3),
-            '25th': round(float(metric_values.quantile(0.25)), 3),
-            '50th': round(float(metric_values.quantile(0.50)), 3),
-            '75th': round(float(metric_values.quantile(0.75)), 3),
-            '90th': round(float(metric_values.quantile(0.90)), 3),
-            'min': round(float(metric_values.min()), 3),
-            'max': round(float(metric_values.max()), 3),
+        percentiles = {key: round(value, 3) for key, value in entry['quantiles'].items()}
+        percentiles.update({
+            'min': round(float(metric_values[0]), 3),
+            'max': round(float(metric_values[-1]), 3),
             'mean': round(float(metric_values.mean()), 3),
             'sample_size': len(metric_values)
-        }
+        })
 
         return {
             'position': position,
@@ -455,69 +676,31 @@ class PercentileRankingSystem:
 
     def get_team_percentiles(self, team_name: str) -> Dict:
         """Get percentile rankings for team-level metrics."""
-        team_data = self.data[self.data['Team'] == team_name]
+        team_aggregates = self._get_team_aggregates()
 
-        if team_data.empty:
+        if team_name not in team_aggregates.index:
             logger.warning(f"Team '{team_name}' not found")
             return {}
 
-        # Aggregate team-level metrics
-        team_metrics = {
-            'total_goals': pd.to_numeric(team_data.get('Goals', 0), errors='coerce').sum(),
-            'total_assists': pd.to_numeric(team_data.get('Assists', 0), errors='coerce').sum(),
-            'avg_pass_accuracy': pd.to_numeric(team_data.get('Accurate passes, %', 0), errors='coerce').mean(),
-            'total_tackles': pd.to_numeric(team_data.get('Tackles per 90', 0), errors='coerce').sum(),
-            'total_interceptions': pd.to_numeric(team_data.get('Interceptions per 90', 0), errors='coerce').sum(),
-            'squad_size': len(team_data)
-        }
-
-        # Calculate percentiles vs other teams
-        all_teams = self.data['Team'].unique()
+        team_metrics = team_aggregates.loc[team_name]
         team_percentiles = {}
 
-        for metric_name, team_value in team_metrics.items():
-            if metric_name == 'squad_size':
+        # Calculate percentiles vs other teams
+        for metric_name in TEAM_PERCENTILE_METRICS:
+            if metric_name not in team_aggregates.columns:
                 continue
 
-            # Get same metric for all teams
-            team_values = []
-            for other_team in all_teams:
-                other_team_data = self.data[self.data['Team'] == other_team]
-
-                if 'total' in metric_name:
-                    col_name = metric_name.replace('total_', '').replace('_', ' ').title()
-                    if 'Goals' in col_name:
-                        col_name = 'Goals'
-                    elif 'Assists' in col_name:
-                        col_name = 'Assists'
-                    elif 'Tackles' in col_name:
-                        col_name = 'Tackles per 90'
-                    elif 'Interceptions' in col_name:
-                        col_name = 'Interceptions per 90'
-
-                    other_value = pd.to_numeric(other_team_data.get(col_name, 0), errors='coerce').sum()
-                elif 'avg' in metric_name:
-                    col_name = metric_name.replace('avg_', '').replace('_', ' ').title()
-                    if 'Pass Accuracy' in col_name:
-                        col_name = 'Accurate passes, %'
-
-                    other_value = pd.to_numeric(other_team_data.get(col_name, 0), errors='coerce').mean()
-                else:
-                    continue
-
-                team_values.append(other_value)
-
-            if len(team_values) > 0:
-                percentile = (sum(v < team_value for v in team_values) / len(team_values)) * 100
-                team_percentiles[metric_name] = {
-                    'value': round(float(team_value), 3),
-                    'percentile': round(float(percentile), 2)
-                }
+            team_value = team_metrics[metric_name]
+            percentile = (team_aggregates[metric_name] < team_value).mean() * 100
+            team_percentiles[metric_name] = {
+                'value': round(float(team_value), 3),
+                'percentile': round(float(percentile), 2)
+            }
 
         return {
             'team': team_name,
             'metrics': team_percentiles,
-            'squad_size': team_metrics['squad_size']
+            'squad_size': int(team_metrics['squad_size'])
         }
 
     # Ranking Methods
@@ -528,34 +711,27 @@ class PercentileRankingSystem:
         Get top N players in position for specific metric.
         Returns ranked list with percentile position.
         """
-        position_data = self.data[self.data.get('Position_Group', '') == position]
-
-        if position_data.empty or metric not in position_data.columns:
+        if position not in self._position_set or metric not in self.data.columns:
             logger.warning(f"Position '{position}' or metric '{metric}' not available")
             return []
 
-        # Sort by metric (descending)
-        metric_values = pd.to_numeric(position_data[metric], errors='coerce')
-        position_data = position_data.copy()
-        position_data['_metric_value'] = metric_values
-
-        # Drop NaN values and sort
-        position_data = position_data.dropna(subset=['_metric_value'])
-        position_data = position_data.sort_values('_metric_value', ascending=False)
+        position_data = self._position_rows(position)
+        values = self._metric_values(position_data, metric).to_numpy(dtype=RANKING_DTYPE)
 
-        # Get top N
-        top_players = position_data.head(top_n)
+        # Get top N by metric (descending), ignoring NaN values
+        top_order, total_players = _top_n_order(values, top_n)
+        players = _column_values(position_data, 'Player', 'Unknown')[top_order]
+        teams = _column_values(position_data, 'Team', 'Unknown')[top_order]
 
         rankings = []
-        total_players = len(position_data)
 
-        for idx, (_, row) in enumerate(top_players.iterrows(), start=1):
+        for idx, (player, team, value) in enumerate(zip(players, teams, values[top_order]), start=1):
             percentile = ((total_players - idx) / total_players) * 100
             rankings.append({
                 'rank': idx,
-                'player': row['Player'] if 'Player' in row else 'Unknown',
-                'team': row['Team'] if 'Team' in row else 'Unknown',
-                'value': round(float(row['_metric_value']), 3),
+                'player': player,
+                'team': team,
+                'value': round(float(value), 3),
                 'percentile': round(percentile, 2)
             })
 
@@ -566,42 +742,37 @@ class PercentileRankingSystem:
                            top_n: int = 10) -> List[Dict]:
         """Get league-wide rankings for metric."""
         # Filter players with minimum matches
-        if 'Matches played' in self.data.columns:
-            qualified_data = self.data[
-                pd.to_numeric(self.data['Matches played'], errors='coerce') >= min_matches
-            ]
-        else:
-            qualified_data = self.data
-
-        if metric not in qualified_data.columns:
+        if metric not in self.data.columns:
             logger.warning(f"Metric '{metric}' not available")
             return []
 
-        # Sort by metric (descending)
-        metric_values = pd.to_numeric(qualified_data[metric], errors='coerce')
-        qualified_data = qualified_data.copy()
-        qualified_data['_metric_value'] = metric_values
+        values = self._league_values(metric).to_numpy(dtype=RANKING_DTYPE)
+        if 'Matches played' in self._num.columns:
+            # Unqualified players are masked out as NaN rather than filtered
+            qualified = self._num['Matches played'].to_numpy() >= min_matches
+            values = np.where(qualified, values, np.nan)
 
-        # Drop NaN values and sort
-        qualified_data = qualified_data.dropna(subset=['_metric_value'])
-        qualified_data = qualified_data.sort_values('_metric_value', ascending=False)
-
-        # Get top N
-        top_players = qualified_data.head(top_n)
+        # Get top N by metric (descending), ignoring NaN values
+        top_order, total_players = _top_n_order(values, top_n)
+        players = _column_values(self._num, 'Player', 'Unknown')[top_order]
+        teams = _column_values(self._num, 'Team', 'Unknown')[top_order]
+        positions = _column_values(self._num, 'Position_Group', 'Unknown')[top_order]
+        matches = _column_values(self._num, 'Matches played', 0)[top_order]
 
         rankings = []
-        total_players = len(qualified_data)
 
-        for idx, (_, row) in enumerate(top_players.iterrows(), start=1):
+        for idx, (player, team, position, value, matches_played) in enumerate(
+            zip(players, teams, positions, values[top_order], matches), start=1
+        ):
             percentile = ((total_players - idx) / total_players) * 100
             rankings.append({
                 'rank': idx,
-                'player': row['Player'] if 'Player' in row else 'Unknown',
-                'team': row['Team'] if 'Team' in row else 'Unknown',
-                'position': row['Position_Group'] if 'Position_Group' in row else 'Unknown',
-                'value': round(float(row['_metric_value']), 3),
+                'player': player,
+                'team': team,
+                'position': position,
+                'value': round(float(value), 3),
                 'percentile': round(percentile, 2),
-                'matches_played': int(row['Matches played']) if 'Matches played' in row else 0
+                'matches_played': int(matches_played)
             })
 
         return rankings
@@ -613,11 +784,10 @@ class PercentileRankingSystem:
         Get player's rank relative to peers.
         Returns: rank, percentile, min, max, mean, std
         """
-        player_data = self.data[self.data['Player'] == player_name]
-
-        if player_data.empty:
+        if player_name not in self._player_set:
             logger.warning(f"Player '{player_name}' not found")
             return {}
+        player_data = self._by_player.loc[[player_name]]
 
         position = player_data['Position_Group'].iloc[0] if 'Position_Group' in player_data.columns else None
 
@@ -625,20 +795,19 @@ class PercentileRankingSystem:
             return {}
 
         # Get position peers
-        position_data = self.data[self.data.get('Position_Group', '') == position]
-        metric_values = pd.to_numeric(position_data[metric], errors='coerce').dropna()
+        metric_values = self._position_array(position, metric)
 
         if len(metric_values) == 0:
             return {}
 
-        player_value = pd.to_numeric(player_data[metric].iloc[0], errors='coerce')
+        player_value = self._metric_values(player_data, metric).iloc[0]
 
         if pd.isna(player_value):
             return {}
 
         # Calculate rank (1-indexed, lower number = better)
-        rank = (metric_values > player_value).sum() + 1
-        percentile = ((metric_values < player_value).sum() / len(metric_values)) * 100
+        rank = len(metric_values) - np.searchsorted(metric_values, player_value, side='right') + 1
+        percentile = (np.searchsorted(metric_values, player_value, side='left') / len(metric_values)) * 100
 
         return {
             'player': player_name,
@@ -648,65 +817,154 @@ class PercentileRankingSystem:
             'rank': int(rank),
             'total_in_position': len(metric_values),
             'percentile': round(float(percentile), 2),
-            'min': round(float(metric_values.min()), 3),
-            'max': round(float(metric_values.max()), 3),
+            'min': round(float(metric_values[0]), 3),
+            'max': round(float(metric_values[-1]), 3),
             'mean': round(float(metric_values.mean()), 3),
-            'std': round(float(metric_values.std()), 3)
+            'std': round(float(metric_values.std(ddof=1)) if len(metric_values) > 1 else float('nan'), 3)
         }
 
+    def _metric_values(self, frame: pd.DataFrame, metric: str) -> pd.Series:
+        """
+        metric of frame (the numeric view or a slice of it) as numbers.
+        Columns outside NUMERIC_COLS are coerced on a copy; the views are never modified.
+        """
+        if metric in self._numeric_cols:
+            return frame[metric]
+        return _coerce(frame[metric], dtype=RANKING_DTYPE)
+
+    def _league_values(self, metric: str) -> pd.Series:
+        """League-wide metric as numbers; coerced columns are kept per metric."""
+        values = self._coerced.get(metric)
+        if values is None:
+            values = self._metric_values(self._num, metric)
+            if metric not in self._numeric_cols:
+                self._coerced[metric] = values
+        return values
+
+    # Views built on first use, so constructing the calculator copies nothing
+    @cached_property
+    def _num(self) -> pd.DataFrame:
+        """Copy of the data with NUMERIC_COLS coerced to numbers."""
+        return _numeric_view(self.data, dtype=RANKING_DTYPE)
+
+    @cached_property
+    def _by_player(self) -> pd.DataFrame:
+        """Numeric view indexed by player for direct lookups."""
+        return _index_by(self._num, 'Player')
+
+    @cached_property
+    def _by_pos(self) -> pd.DataFrame:
+        """Numeric view sorted by position, one contiguous slice per position."""
+        return _index_by(self._num, 'Position_Group', sort=True)
+
+    def _get_team_aggregates(self) -> pd.DataFrame:
+        """Per-team totals/averages for every team, computed in one groupby pass."""
+        if self._team_aggregates is None:
+            aggregations = {
+                name: (column, func)
+                for name, (column, func) in TEAM_PERCENTILE_METRICS.items()
+                if column in self._num.columns
+            }
+            self._team_aggregates = self._num.groupby('Team').agg(
+                squad_size=('Team', 'size'), **aggregations
+            )
+        return self._team_aggregates
+
+    def _position_rows(self, position: str) -> pd.DataFrame:
+        """Rows of position as a contiguous slice of the position-sorted view."""
+        return self._by_pos.iloc[self._by_pos.index.slice_indexer(position, position)]
+
+    def _percentile_entry(self, position: str, metric: str) -> Dict:
+        """Cached sorted values and cut points of metric within position (None for league)."""
+        key = (position, metric)
+        entry = self._cache_get(key)
+        if entry is None:
+            sorted_values = self._sorted_values(position, metric)
+            quantiles = _percentile_cut_points(sorted_values) if len(sorted_values) > 0 else {}
+            entry = {'sorted': sorted_values, 'quantiles': quantiles}
+            self._cache_set(key, entry)
+        return entry
+
+    def _position_array(self, position: str, metric: str) -> np.ndarray:
+        """Sorted non-NaN values of metric within position, from the shared cache."""
+        return self._percentile_entry(position, metric)['sorted']
+
+    def _sorted_values(self, position: str, metric: str) -> np.ndarray:
+        """Sorted non-NaN values of metric within position (None for the whole league)."""
+        if position is None:
+            values = self._league_values(metric).to_numpy(dtype=RANKING_DTYPE)
+        else:
+            values = self._metric_values(self._position_rows(position), metric).to_numpy(dtype=RANKING_DTYPE)
+        return np.sort(values[~np.isnan(values)])
+
     # Cache Management
     def compute_all_percentiles(self, metrics: List[str]) -> None:
         """Pre-compute all percentiles for list of metrics."""
         logger.info(f"Pre-computing percentiles for {len(metrics)} metrics...")
 
-        positions = self.data['Position_Group'].unique() if 'Position_Group' in self.data.columns else []
-
-        for metric in metrics:
-            if metric not in self.data.columns:
-                continue
-
-            # Cache league-wide percentiles
-            cache_key = f"league_{metric}"
-            metric_values = pd.to_numeric(self.data[metric], errors='coerce').dropna()
-
-            if len(metric_values) > 0:
-                self._percentile_cache[cache_key] = {
-                    '10th': float(metric_values.quantile(0.10)),
-                    '25th': float(metric_values.quantile(0.25)),
-                    '50th': float(metric_values.quantile(0.50)),
-                    '75th': float(metric_values.quantile(0.75)),
-                    '90th': float(metric_values.quantile(0.90))
-                }
-
-            # Cache position-specific percentiles
-            for position in positions:
-                position_data = self.data[self.data['Position_Group'] == position]
-                position_metric_values = pd.to_numeric(position_data[metric], errors='coerce').dropna()
-
-                if len(position_metric_values) > 0:
-                    cache_key = f"{position}_{metric}"
-                    self._percentile_cache[cache_key] = {
-                        '10th': float(position_metric_values.quantile(0.10)),
-                        '25th': float(position_metric_values.quantile(0.25)),
-                        '50th': float(position_metric_values.quantile(0.50)),
-                        '75th': float(position_metric_values.quantile(0.75)),
-                        '90th': float(position_metric_values.quantile(0.90))
-                    }
+        columns = list(dict.fromkeys(m for m in metrics if m in self.data.columns))
+        # Position codes of the position-sorted view, shared by every metric
+        codes, positions = pd.factorize(self._by_pos.index)
+
+        for metric in columns:
+            league_values = self._sorted_values(None, metric)
+            if len(league_values) > 0:
+                self._cache_set((None, metric), {
+                    'sorted': league_values,
+                    'quantiles': _percentile_cut_points(league_values)
+                })
+
+            # One sort by (position, value); each position is then a contiguous slice
+            values = self._metric_values(self._by_pos, metric).to_numpy(dtype=RANKING_DTYPE)
+            valid = ~np.isnan(values)
+            values, value_codes = values[valid], codes[valid]
+            order = np.lexsort((values, value_codes))
+            values, value_codes = values[order], value_codes[order]
+            bounds = np.searchsorted(value_codes, np.arange(len(positions) + 1))
+
+            for position, start, stop in zip(positions, bounds[:-1], bounds[1:]):
+                if stop > start:
+                    sorted_values = values[start:stop]
+                    self._cache_set((position, metric), {
+                        'sorted': sorted_values,
+                        'quantiles': _percentile_cut_points(sorted_values)
+                    })
 
         logger.info(f"Cached {len(self._percentile_cache)} percentile distributions")
 
+    def _cache_get(self, key: tuple):
+        """Cached entry for key (marked most recently used), or None."""
+        entry = self._percentile_cache.get(key)
+        if entry is not None:
+            self._percentile_cache.move_to_end(key)
+        return entry
+
+    def _cache_set(self, key: tuple, entry: Dict) -> None:
+        """Store an entry (LRU-bounded) and keep the cache size estimate current."""
+        previous = self._percentile_cache.get(key)
+        if previous is not None:
+            self._percentile_cache_bytes -= _cache_entry_size(key, previous)
+            self._percentile_cache.move_to_end(key)
+        self._percentile_cache[key] = entry
+        self._percentile_cache_bytes += _cache_entry_size(key, entry)
+
+        while len(self._percentile_cache) > self._cache_maxsize:
+            old_key, old_value = self._percentile_cache.popitem(last=False)
+            self._percentile_cache_bytes -= _cache_entry_size(old_key, old_value)
+
     def clear_cache(self) -> None:
         """Clear percentile cache."""
         self._percentile_cache.clear()
         self._ranking_cache.clear()
+        self._percentile_cache_bytes = 0
+        self._ranking_cache_bytes = 0
+        self._team_aggregates = None
         logger.info("Cache cleared")
 
     def get_cache_stats(self) -> Dict:
-        """Report cache hit rates and memory usage."""
-        import sys
-
-        percentile_cache_size = sys.getsizeof(self._percentile_cache)
-        ranking_cache_size = sys.getsizeof(self._ranking_cache)
+        """Report cache entries and estimated memory usage."""
+        percentile_cache_size = self._percentile_cache_bytes
+        ranking_cache_size = self._ranking_cache_bytes
         total_size = percentile_cache_size + ranking_cache_size
 
         return {
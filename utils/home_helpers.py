@@ -9,6 +9,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Props compartidos por los badges de temporadas disponibles
+_SEASON_BADGE_STYLE = {"font-size": "0.8rem"}
+_SEASON_BADGE_CLS = "me-1 mb-1"
+
 def create_performance_section(performance_status):
     """
     Crea la sección de información de performance.
@@ -23,15 +27,12 @@ def create_performance_section(performance_status):
     available_seasons = performance_status.get('available_seasons', [])
     
     available_seasons_badges = [
-        dbc.Badge(format_season_short(s), 
-            color="info", 
-            className="me-1 mb-1",
-            style={"font-size": "0.8rem"}) 
+        dbc.Badge(format_season_short(s), color="info", className=_SEASON_BADGE_CLS, style=_SEASON_BADGE_STYLE)
         for s in available_seasons
     ]
     
-    return dbc.ListGroupItem([
-        html.Div([
+    return dbc.ListGroupItem((
+        html.Div((
             html.Strong("⚽ PERFORMANCE DATA"),
             html.Hr(className="my-2"),
             html.Strong("🗓️ Temporada actual: "),
@@ -39,8 +40,8 @@ def create_performance_section(performance_status):
             html.Br(),
             html.Small("Disponibles: ", className="me-1"),
             html.Span(available_seasons_badges)
-        ])
-    ])
+        )),
+    ))
 
 def create_performance_status_section(performance_status):
     """
@@ -59,19 +60,18 @@ def create_performance_status_section(performance_status):
     performance_data_available = len(cached_seasons) > 0
     
     # Estadísticas de performance
-    performance_info = []
     if 'data_stats' in performance_status and performance_data_available:
         stats = performance_status['data_stats']
-        performance_info = [
+        performance_info = (
             html.Small(f"📊 {stats.get('total_players', 0)} jugadores, {stats.get('total_teams', 0)} equipos"),
             html.Br(),
             html.Small(f"🕐 Actualizado: {formatted_date_performance}")
-        ]
+        )
     else:
-        performance_info = [html.Small("⚠️ Sin datos de performance")]
+        performance_info = (html.Small("⚠️ Sin datos de performance"),)
     
-    return dbc.ListGroupItem([
-        html.Div([
+    return dbc.ListGroupItem((
+        html.Div((
             html.Strong("📋 Estado Performance: "),
             dbc.Badge(
                 "Disponible" if performance_data_available else "No disponible", 
@@ -80,79 +80,125 @@ def create_performance_status_section(performance_status):
             ),
             html.Br(),
             *performance_info
-        ])
-    ])
+        )),
+    ))
 
-def create_injuries_section(injuries_data, injuries_stats, transfermarkt_manager):
-    """
-    Crea la sección de información de lesiones.
-    
-    Args:
-        injuries_data (list): Datos de lesiones
-        injuries_stats (dict): Estadísticas de lesiones
-        transfermarkt_manager: Manager de datos de Transfermarkt
-        
-    Returns:
-        dbc.ListGroupItem: Item con información de lesiones
-    """
+# Posiciones dentro del Div del item de lesiones que cambian entre refrescos
+_INJURIES_BADGE_POS = 3
+_INJURIES_INFO_POS = 5
+
+def _injuries_section_values(injuries_data, injuries_stats, transfermarkt_manager, teams_with_injuries=None):
+    """Reduce las entradas de la sección de lesiones a los valores que muestra."""
     injuries_available = len(injuries_data) > 0
-    injuries_teams = transfermarkt_manager.get_teams_with_injuries() if injuries_available else []
+    if not injuries_available:
+        injuries_teams = []
+    elif teams_with_injuries is not None:
+        injuries_teams = teams_with_injuries
+    else:
+        injuries_teams = transfermarkt_manager.get_teams_with_injuries()
     
     # Obtener timestamp de lesiones
     last_update_injuries = injuries_stats.get('last_update') if injuries_available else None
+    active_injuries = injuries_stats.get('active_injuries', 0) if injuries_available else 0
+    
+    return len(injuries_data), active_injuries, len(injuries_teams), last_update_injuries
+
+def _injuries_section_content(injuries_count, active_injuries, teams_count, last_update_injuries):
+    """
+    Calcula las partes variables de la sección de lesiones.
+    
+    Returns:
+        tuple: (texto del badge, color del badge, tupla de hijos con la información)
+    """
+    injuries_available = injuries_count > 0
     formatted_date_injuries = format_datetime(last_update_injuries)
     
-    injuries_info = []
     if injuries_available:
-        active_injuries = injuries_stats.get('active_injuries', 0)
-        injuries_info = [
-            html.Small(f"📊 {len(injuries_data)} lesiones registradas"),
+        injuries_info = (
+            html.Small(f"📊 {injuries_count} lesiones registradas"),
             html.Br(),
             html.Small(f"🏥 {active_injuries} lesiones activas"),
             html.Br(),
-            html.Small(f"⚽ {len(injuries_teams)} equipos con lesiones"),
+            html.Small(f"⚽ {teams_count} equipos con lesiones"),
             html.Br(),
             html.Small(f"🕐 Actualizado: {formatted_date_injuries}")
-        ]
+        )
     else:
-        injuries_info = [
+        injuries_info = (
             html.Small("⚠️ Sin datos de lesiones"),
             html.Br(),
             html.Small(f"🕐 Último intento: {formatted_date_injuries}")
-        ]
+        )
+    
+    return (
+        "Disponible" if injuries_available else "No disponible",
+        "success" if injuries_available else "danger",
+        injuries_info
+    )
+
+def create_injuries_section(injuries_data, injuries_stats, transfermarkt_manager, teams_with_injuries=None):
+    """
+    Crea la sección de información de lesiones.
+    
+    Args:
+        injuries_data (list): Datos de lesiones
+        injuries_stats (dict): Estadísticas de lesiones
+        transfermarkt_manager: Manager de datos de Transfermarkt
+        teams_with_injuries (list, optional): Equipos con lesiones ya calculados por el llamador
+        
+    Returns:
+        dbc.ListGroupItem: Item con información de lesiones
+    """
+    badge_label, badge_color, injuries_info = _injuries_section_content(*_injuries_section_values(
+        injuries_data, injuries_stats, transfermarkt_manager, teams_with_injuries
+    ))
     
-    return dbc.ListGroupItem([
-        html.Div([
+    return dbc.ListGroupItem((
+        html.Div((
             html.Strong("🏥 INJURIES DATA"),
             html.Hr(className="my-2"),
             html.Strong("📋 Estado Lesiones: "),
-            dbc.Badge(
-                "Disponible" if injuries_available else "No disponible", 
-                color="success" if injuries_available else "danger",
-                className="ms-2"
-            ),
+            dbc.Badge(badge_label, color=badge_color, className="ms-2"),
             html.Br(),
-            *injuries_info
-        ])
-    ])
+            html.Span(injuries_info)
+        )),
+    ))
 
-def create_overall_status_section(performance_data_available, injuries_available, data_manager=None, transfermarkt_manager=None):
+def patch_injuries_section(item_patch, injuries_data, injuries_stats, transfermarkt_manager, teams_with_injuries=None):
+    """
+    Actualiza en sitio una sección de lesiones ya renderizada.
+    
+    Solo se envían el badge y los textos; la estructura creada por
+    create_injuries_section se mantiene en el navegador.
+    
+    Args:
+        item_patch (dash.Patch): Patch que apunta al ListGroupItem de lesiones
+        injuries_data (list): Datos de lesiones
+        injuries_stats (dict): Estadísticas de lesiones
+        transfermarkt_manager: Manager de datos de Transfermarkt
+        teams_with_injuries (list, optional): Equipos con lesiones ya calculados por el llamador
     """
-    Crea la sección de estado general del sistema.
-    Versión simplificada que confía en la lógica mejorada de verificación.
+    badge_label, badge_color, injuries_info = _injuries_section_content(*_injuries_section_values(
+        injuries_data, injuries_stats, transfermarkt_manager, teams_with_injuries
+    ))
+    
+    content = item_patch['props']['children'][0]['props']['children']
+    content[_INJURIES_BADGE_POS]['props']['children'] = badge_label
+    content[_INJURIES_BADGE_POS]['props']['color'] = badge_color
+    content[_INJURIES_INFO_POS]['props']['children'] = injuries_info
+
+def get_overall_status_flags(performance_data_available, injuries_available, data_manager=None):
     """
-    # Estado básico del sistema
-    if performance_data_available and injuries_available:
-        overall_status = "success"
-        overall_message = "All systems operational"
-    elif performance_data_available or injuries_available:
-        overall_status = "warning" 
-        overall_message = "Partial systems operational"
-    else:
-        overall_status = "danger"
-        overall_message = "Systems not available"
+    Calcula los indicadores del estado general del sistema.
     
-    # Verificar actualizaciones disponibles 
+    Args:
+        performance_data_available (bool): Si hay datos de performance
+        injuries_available (bool): Si hay datos de lesiones
+        data_manager: Manager de datos de performance
+        
+    Returns:
+        dict: Indicadores serializables para el dcc.Store del banner
+    """
     updates_available = []
     
     # Verificar actualizaciones de performance
@@ -167,42 +213,26 @@ def create_overall_status_section(performance_data_available, injuries_available
         except Exception as e:
             logger.warning(f"Error checking performance updates: {e}")
     
-    # Crear componente de estado
-    status_content = [
-        html.Strong("🔧 Status: "),
-        dbc.Badge(overall_message, color=overall_status, className="ms-2")
-    ]
-    
-    # Mostrar estado de actualizaciones
-    if updates_available:
-        status_content.extend([
-            html.Br(),
-            html.Br(),
-            html.Strong("🔔 Updates Available: "),
-            html.Br(),
-            html.Small(f"• {', '.join(updates_available)} can be updated", className="text-warning")
-        ])
-        if overall_status == "success":
-            overall_status = "info"
-    else:
-        status_content.extend([
-            html.Br(),
-            html.Small("✅ All data is up to date", className="text-success")
-        ])
-    
-    return dbc.ListGroupItem([
-        html.Div(status_content)
-    ], color="light")
+    return {
+        'performance_data_available': bool(performance_data_available),
+        'injuries_available': bool(injuries_available),
+        'updates_available': updates_available
+    }
 
-def create_update_results_section(performance_updated, injuries_updated, data_manager, transfermarkt_manager, update_errors):
+def create_update_results_section(performance_updated, injuries_updated, performance_status, injuries_data,
+                                  teams_with_injuries, update_errors):
     """
     Crea la sección de resultados de actualización.
     
+    Recibe los datos ya consultados por el llamador tras la actualización,
+    sin volver a preguntar a los managers.
+    
     Args:
         performance_updated (bool): Si se actualizó performance
         injuries_updated (bool): Si se actualizaron lesiones
-        data_manager: Manager de datos de performance
-        transfermarkt_manager: Manager de datos de lesiones
+        performance_status (dict): Estado del sistema de performance
+        injuries_data (list): Datos de lesiones
+        teams_with_injuries (list): Equipos con lesiones
         update_errors (list): Lista de errores
         
     Returns:
@@ -214,22 +244,13 @@ def create_update_results_section(performance_updated, injuries_updated, data_ma
     update_results = []
     
     if performance_updated:
-        try:
-            updated_status = data_manager.get_data_status()
-            teams_count = updated_status.get('data_stats', {}).get('total_teams', 0)
-            players_count = updated_status.get('data_stats', {}).get('total_players', 0)
-            update_results.append(f"⚽ Performance: {players_count} jugadores de {teams_count} equipos")
-        except Exception as e:
-            logger.warning(f"Error getting updated performance stats: {e}")
+        data_stats = performance_status.get('data_stats', {})
+        teams_count = data_stats.get('total_teams', 0)
+        players_count = data_stats.get('total_players', 0)
+        update_results.append(f"⚽ Performance: {players_count} jugadores de {teams_count} equipos")
     
     if injuries_updated:
-        try:
-            updated_injuries = transfermarkt_manager.get_injuries_data()
-            injuries_count = len(updated_injuries)
-            teams_with_injuries = len(transfermarkt_manager.get_teams_with_injuries())
-            update_results.append(f"🏥 Lesiones: {injuries_count} lesiones de {teams_with_injuries} equipos")
-        except Exception as e:
-            logger.warning(f"Error getting updated injuries stats: {e}")
+        update_results.append(f"🏥 Lesiones: {len(injuries_data)} lesiones de {len(teams_with_injuries)} equipos")
     
     if update_results:
         # Determinar si fue manual o automático basado en el contexto
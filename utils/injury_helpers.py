@@ -4,12 +4,30 @@ Funciones auxiliares para evitar duplicación de código en injury_callbacks.
 """
 
 from typing import List, Dict, Optional, Tuple
+from collections import Counter
 from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
 import plotly.express as px
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
-from .common import validate_data, safe_division, get_top_items
+from .common import validate_data, safe_division
+
+# Días hacia atrás de cada período del filtro de lesiones
+PERIOD_DAYS = {'1m': 30, '3m': 90, '6m': 180, 'season': 365}
+
+# Columnas de la tabla de lesiones: campo origen -> (cabecera, valor por defecto)
+TABLE_COLUMNS = {
+    'player_name': ('Jugador', 'N/A'),
+    'team': ('Equipo', 'N/A'),
+    'injury_type': ('Tipo', 'N/A'),
+    'body_part': ('Zona', 'N/A'),
+    'severity': ('Severidad', 'N/A'),
+    'injury_date': ('Fecha', ''),
+    'recovery_days': ('Días Rec.', 0),
+    'status': ('Estado', 'N/A'),
+}
 
 def filter_injuries_by_team(injuries: List[Dict], team: Optional[str]) -> List[Dict]:
     """
@@ -27,6 +45,21 @@ def filter_injuries_by_team(injuries: List[Dict], team: Optional[str]) -> List[D
     
     return [injury for injury in injuries if injury.get('team') == team]
 
+def _parse_injury_dates(injuries: List[Dict]) -> pd.DatetimeIndex:
+    """
+    Parsea 'injury_date' (formato YYYY-MM-DD) de todas las lesiones de una vez.
+    
+    Args:
+        injuries: Lista de lesiones
+        
+    Returns:
+        DatetimeIndex alineado con injuries, con NaT donde no hay fecha válida
+    """
+    return pd.to_datetime(
+        [injury.get('injury_date') or None for injury in injuries],
+        format='%Y-%m-%d', errors='coerce'
+    )
+
 def filter_injuries_by_period(injuries: List[Dict], period: str) -> List[Dict]:
     """
     Filtra lesiones por período de tiempo.
@@ -41,26 +74,47 @@ def filter_injuries_by_period(injuries: List[Dict], period: str) -> List[Dict]:
     if period == 'all':
         return injuries
     
-    days_map = {'1m': 30, '3m': 90, '6m': 180, 'season': 365}
-    days_back = days_map.get(period, 90)
-    cutoff_date = datetime.now() - timedelta(days=days_back)
+    days_back = PERIOD_DAYS.get(period, 90)
+    cutoff_date = pd.Timestamp(datetime.now() - timedelta(days=days_back))
+    
+    # Parseo vectorizado; fechas ausentes o inválidas quedan como NaT
+    injury_dates = _parse_injury_dates(injuries)
+    
+    # Si no hay fecha o no se puede parsear, incluir el registro
+    keep = injury_dates.isna() | (injury_dates >= cutoff_date)
+    
+    return [injury for injury, keep_injury in zip(injuries, keep) if keep_injury]
+
+def _tally(injuries: List[Dict]) -> Tuple[Counter, Counter, int, int, float]:
+    """
+    Recorre las lesiones una sola vez y devuelve los conteos compartidos.
+    
+    Args:
+        injuries: Lista de lesiones
+        
+    Returns:
+        Tupla con (conteo por tipo, conteo por zona, total, activas, promedio de días de recuperación)
+    """
+    injury_counts = Counter()
+    body_part_counts = Counter()
+    active_injuries = 0
+    recovery_sum = 0
+    recovery_count = 0
     
-    filtered_data = []
     for injury in injuries:
-        injury_date_str = injury.get('injury_date')
-        if injury_date_str:
-            try:
-                injury_date = datetime.strptime(injury_date_str, '%Y-%m-%d')
-                if injury_date >= cutoff_date:
-                    filtered_data.append(injury)
-            except:
-                # Si hay error parseando fecha, incluir el registro
-                filtered_data.append(injury)
-        else:
-            # Si no hay fecha, incluir el registro
-            filtered_data.append(injury)
-    
-    return filtered_data
+        injury_counts[injury.get('injury_type', 'Desconocida')] += 1
+        body_part_counts[injury.get('body_part', 'Otros')] += 1
+        
+        if injury.get('status') == 'En tratamiento':
+            active_injuries += 1
+        
+        recovery = injury.get('recovery_days')
+        if recovery:
+            recovery_sum += recovery
+            recovery_count += 1
+    
+    avg_recovery_days = safe_division(recovery_sum, recovery_count)
+    return injury_counts, body_part_counts, len(injuries), active_injuries, avg_recovery_days
 
 def calculate_injury_statistics(injuries: List[Dict]) -> Dict:
     """
@@ -81,28 +135,11 @@ def calculate_injury_statistics(injuries: List[Dict]) -> Dict:
             'most_affected_part': 'N/A'
         }
     
-    total_injuries = len(injuries)
-    active_injuries = len([injury for injury in injuries if injury.get('status') == 'En tratamiento'])
-    
-    # Días de recuperación promedio
-    recovery_days = [injury.get('recovery_days', 0) for injury in injuries if injury.get('recovery_days')]
-    avg_recovery_days = safe_division(sum(recovery_days), len(recovery_days))
+    injury_counts, body_part_counts, total_injuries, active_injuries, avg_recovery_days = _tally(injuries)
     
-    # Lesión más común
-    injury_types = [injury.get('injury_type', 'Desconocida') for injury in injuries]
-    injury_counts = {}
-    for injury_type in injury_types:
-        injury_counts[injury_type] = injury_counts.get(injury_type, 0) + 1
-    
-    _, _, most_common_injury = get_top_items(injury_counts, 1, "N/A")
-    
-    # Parte del cuerpo más afectada
-    body_parts = [injury.get('body_part', 'Otros') for injury in injuries]
-    body_part_counts = {}
-    for body_part in body_parts:
-        body_part_counts[body_part] = body_part_counts.get(body_part, 0) + 1
-    
-    _, _, most_affected_part = get_top_items(body_part_counts, 1, "N/A")
+    # Lesión más común y parte del cuerpo más afectada
+    most_common_injury = injury_counts.most_common(1)[0][0] if injury_counts else 'N/A'
+    most_affected_part = body_part_counts.most_common(1)[0][0] if body_part_counts else 'N/A'
     
     return {
         'total_injuries': total_injuries,
@@ -126,12 +163,10 @@ def get_injury_distribution(injuries: List[Dict], top_n: int = 10) -> Tuple[List
     if not validate_data(injuries):
         return [], []
     
-    injury_types = [injury.get('injury_type', 'Desconocida') for injury in injuries]
-    injury_counts = {}
-    for injury_type in injury_types:
-        injury_counts[injury_type] = injury_counts.get(injury_type, 0) + 1
+    top = _tally(injuries)[0].most_common(top_n)
     
-    types, counts, _ = get_top_items(injury_counts, top_n)
+    types = [injury_type for injury_type, _ in top]
+    counts = [count for _, count in top]
     return types, counts
 
 def get_stats_with_fallback(manager, selected_team: Optional[str], filtered_data: List[Dict]) -> Dict:
@@ -179,21 +214,18 @@ def prepare_table_data(injuries: List[Dict]) -> List[Dict]:
     if not validate_data(injuries):
         return []
     
-    table_data = []
-    for injury in injuries:
-        row = {
-            'Jugador': injury.get('player_name', 'N/A'),
-            'Equipo': injury.get('team', 'N/A'),
-            'Tipo': injury.get('injury_type', 'N/A'),
-            'Zona': injury.get('body_part', 'N/A'),
-            'Severidad': injury.get('severity', 'N/A'),
-            'Fecha': injury.get('injury_date', ''),
-            'Días Rec.': injury.get('recovery_days', 0),
-            'Estado': injury.get('status', 'N/A')
-        }
-        table_data.append(row)
+    # dtype=object conserva los valores tal cual (sin convertir enteros a float)
+    df = pd.DataFrame(injuries, columns=list(TABLE_COLUMNS), dtype=object)
+    defaults = pd.Series({field: default for field, (_, default) in TABLE_COLUMNS.items()})
+    
+    # Solo los campos ausentes (NaN al construir el DataFrame) toman el valor
+    # por defecto; un None explícito se conserva, como con injury.get(campo, defecto)
+    values = df.to_numpy()
+    missing = pd.isna(values) & (values != None)  # noqa: E711 (comparación elemento a elemento)
+    df = df.where(~missing, defaults, axis=1)
+    df.columns = [header for header, _ in TABLE_COLUMNS.values()]
     
-    return table_data
+    return df.to_dict('records')
 
 def get_monthly_trends_data(injuries: List[Dict]) -> Tuple[List[str], List[int]]:
     """
@@ -208,29 +240,20 @@ def get_monthly_trends_data(injuries: List[Dict]) -> Tuple[List[str], List[int]]
     if not validate_data(injuries):
         return [], []
     
-    # Agrupar por mes
-    monthly_counts = {}
+    # Agrupar por mes (se ignoran fechas ausentes o inválidas)
+    injury_dates = _parse_injury_dates(injuries).dropna()
     
-    for injury in injuries:
-        injury_date_str = injury.get('injury_date')
-        if injury_date_str:
-            try:
-                injury_date = datetime.strptime(injury_date_str, '%Y-%m-%d')
-                month_key = injury_date.strftime('%Y-%m')
-                monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
-            except:
-                continue
-    
-    # Ordenar por fecha
-    sorted_months = sorted(monthly_counts.items())
-    
-    if not sorted_months:
+    if injury_dates.empty:
         return [], []
     
-    months = [item[0] for item in sorted_months]
-    counts = [item[1] for item in sorted_months]
+    # Claves numéricas YYYYMM: se formatea solo una vez por mes, no por lesión.
+    # np.unique cuenta y ordena por fecha en una sola pasada
+    month_keys, monthly_counts = np.unique(
+        injury_dates.year * 100 + injury_dates.month, return_counts=True
+    )
     
-    return months, counts
+    months = [f"{key // 100:04d}-{key % 100:02d}" for key in month_keys.tolist()]
+    return months, monthly_counts.tolist()
 
 def get_body_parts_distribution(injuries: List[Dict], top_n: int = 8) -> List[Dict]:
     """
@@ -246,17 +269,11 @@ def get_body_parts_distribution(injuries: List[Dict], top_n: int = 8) -> List[Di
     if not validate_data(injuries):
         return []
     
-    body_parts = [injury.get('body_part', 'Otros') for injury in injuries]
-    body_part_counts = {}
-    for part in body_parts:
-        body_part_counts[part] = body_part_counts.get(part, 0) + 1
-    
-    parts, counts, _ = get_top_items(body_part_counts, top_n)
+    body_part_counts, total_injuries = _tally(injuries)[1:3]
     
-    total_injuries = len(injuries)
     result = []
     
-    for part, count in zip(parts, counts):
+    for part, count in body_part_counts.most_common(top_n):
         percentage = safe_division(count * 100, total_injuries)
         result.append({
             'part': part,
@@ -4,164 +4,399 @@ Utiliza reportlab para crear PDFs personalizados con gráficos y datos.
 Versión simplificada con mejor manejo de errores y menos redundancia.
 """
 
+import os
+from reportlab import rl_config
+
+# La verificación de atributos de ReportLab solo se mantiene al depurar
+# (PDF_DEBUG=true). Se fija antes de importar platypus para que los módulos
+# que leen el valor al importarse ya lo vean desactivado.
+PDF_DEBUG = os.getenv('PDF_DEBUG', 'false').lower() in ('true', '1', 'yes', 'on')
+if not PDF_DEBUG:
+    rl_config.shapeChecking = 0
+
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from io import BytesIO
-from datetime import datetime
+from collections import ChainMap
+from functools import lru_cache, partial
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import time
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Sequence, Tuple, BinaryIO
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+# Buffers devueltos con release_buffer, reutilizados por los siguientes reportes
+BUFFER_POOL_SIZE = 32
+_BUFFER_POOL: "queue.LifoQueue[BytesIO]" = queue.LifoQueue(maxsize=BUFFER_POOL_SIZE)
+
+def _get_pooled_buffer() -> BytesIO:
+    """
+    Obtiene un BytesIO del pool o crea uno nuevo.
+    
+    El buffer reutilizado solo se rebobina: el PDF nuevo sobrescribe su
+    memoria y el sobrante se recorta al terminar (truncate en la posición
+    final), así se conserva la capacidad ya reservada.
+
+    No hace falta un buffer respaldado por bytearray ni reservar tamaño
+    inicial: ReportLab serializa el documento completo (con b''.join) y lo
+    escribe con una única llamada a write(), así que no hay escrituras
+    pequeñas que acumular.
+    """
+    try:
+        buffer = _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return BytesIO()
+    buffer.seek(0)
+    return buffer
+
+def _finish_buffer(buffer: BinaryIO, out: Optional[BinaryIO]) -> BinaryIO:
+    """
+    Deja listo para leer un buffer del pool recién escrito.
+    
+    Un destino del llamador (`out`) conserva su posición.
+    """
+    if out is None:
+        buffer.truncate()  # descarta restos de un PDF anterior más largo
+        buffer.seek(0)
+    return buffer
+
+def release_buffer(buffer: BytesIO) -> None:
+    """
+    Devuelve al pool un buffer de create_*_report cuyos bytes ya se leyeron.
+    
+    El buffer no debe usarse después de liberarlo. Si el pool está lleno se
+    descarta.
+    """
+    try:
+        _BUFFER_POOL.put_nowait(buffer)
+    except queue.Full:
+        pass
+
+# Formato de la fecha de generación mostrada en los reportes
+TIMESTAMP_FORMAT = "%d/%m/%Y %H:%M"
+
+# Última fecha formateada: (minuto desde epoch, texto). Se sustituye la tupla
+# completa de una vez, así que los hilos de generate_batch la leen sin bloqueo
+_timestamp_cache = (None, '')
+
+def _report_timestamp() -> str:
+    """Fecha de generación con TIMESTAMP_FORMAT, formateada una vez por minuto."""
+    global _timestamp_cache
+    minute = int(time.time() // 60)
+    cached_minute, text = _timestamp_cache
+    if minute != cached_minute:
+        text = time.strftime(TIMESTAMP_FORMAT, time.localtime(minute * 60))
+        _timestamp_cache = (minute, text)
+    return text
+
+# Nombre mostrado de cada nivel de análisis
+_LEVEL_NAMES = {'league': 'Full League', 'team': 'Team', 'player': 'Player'}
+
+# Máximo de lesiones listadas en la tabla del reporte
+INJURY_TABLE_MAX_ROWS = 20
+
+# Máximo de goleadores y asistentes listados en los reportes
+TOP_PERFORMERS_MAX_ROWS = 5
+
+def _top_performer_rows(top_performers: Dict) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Primeros goleadores y asistentes a mostrar.
+    
+    top_scorers y top_assisters pueden ser listas o iterables perezosos
+    (p. ej. generadores sobre un DataFrame ordenado): solo se consumen los
+    TOP_PERFORMERS_MAX_ROWS primeros elementos de cada uno.
+    """
+    return (
+        list(islice(top_performers.get('top_scorers') or (), TOP_PERFORMERS_MAX_ROWS)),
+        list(islice(top_performers.get('top_assisters') or (), TOP_PERFORMERS_MAX_ROWS)),
+    )
+
+# Campos de cada lesión mostrados en la tabla del reporte, en orden de columna
+_INJURY_COLS = ('player_name', 'team', 'injury_type', 'body_part', 'severity', 'injury_date', 'status')
+_INJURY_GET = itemgetter(*_INJURY_COLS)
+_INJURY_DEFAULTS = dict.fromkeys(_INJURY_COLS, 'N/A')
+
+# Campos de cada fila de top performers (jugador, equipo y valor del ranking)
+_SCORER_GET = itemgetter('Player', 'Team', 'Goals')
+_ASSISTER_GET = itemgetter('Player', 'Team', 'Assists')
+
+def _ranked_rows(header: List[str], items: Sequence[Dict], getter: itemgetter,
+                 value_key: str) -> List[List[str]]:
+    """
+    Filas de una tabla de ranking: cabecera y, por elemento, posición y campos.
+    
+    Los campos se extraen con un único itemgetter por fila; si a algún
+    elemento le falta un campo se recurre a los valores por defecto
+    ('N/A' o 0) campo a campo, leyendo el valor del ranking de value_key.
+    Un nombre None se muestra como celda vacía, igual que en una Table.
+    """
+    try:
+        return [header] + [
+            [str(i), player or '', team or '', str(value)]
+            for i, (player, team, value) in enumerate(map(getter, items), 1)
+        ]
+    except KeyError:
+        return [header] + [
+            [str(i), item.get('Player', 'N/A') or '', item.get('Team', 'N/A') or '', str(item.get(value_key, 0))]
+            for i, item in enumerate(items, 1)
+        ]
+
+def _standard_table_style(header_color, body_color=colors.lightgrey, align: str = 'CENTER',
+                          header_font_size: int = 10) -> TableStyle:
+    """Estilo común de tabla: cabecera coloreada en negrita, cuerpo de un color y rejilla."""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), header_color),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), align),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), body_color),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+# Estilos de tabla compartidos: TableStyle no se modifica al aplicarse
+_DEFAULT_TABLE_STYLE = _standard_table_style(colors.grey)
+_SCORER_STYLE = _standard_table_style(colors.darkred)
+_ASSISTER_STYLE = _standard_table_style(colors.darkgreen)
+_POSITION_STYLE = _standard_table_style(colors.darkblue)
+_KPI_STYLE = _standard_table_style(colors.grey, colors.beige, align='LEFT', header_font_size=12)
+_INJURY_SUMMARY_STYLE = _standard_table_style(colors.darkred, colors.lightpink, align='LEFT')
+
+# Tabla de lesiones: cabecera de 8 puntos y cuerpo de 7 para que quepan las siete columnas
+_INJURY_TABLE_STYLE = _standard_table_style(colors.darkred, header_font_size=8)
+_INJURY_TABLE_STYLE.add('FONTSIZE', (0, 1), (-1, -1), 7)
+
+def _league_kpi_rows(overview: Dict) -> List[List[str]]:
+    """Filas KPI del análisis de liga."""
+    return [
+        ['Métrica', 'Valor'],
+        ['Total Players', str(overview.get('total_players', 0))],
+        ['Total Teams', str(overview.get('total_teams', 0))],
+        ['Total Goals', str(overview.get('total_goals', 0))],
+        ['Total Assists', str(overview.get('total_assists', 0))],
+        ['Avg. Age', f"{overview.get('average_age', 0)} años"],
+        ['Goals per Player', str(overview.get('avg_goals_per_player', 0))]
+    ]
+
+def _team_kpi_rows(overview: Dict) -> List[List[str]]:
+    """Filas KPI del análisis de equipo."""
+    return [
+        ['Métrica', 'Valor'],
+        ['Team', overview.get('team_name', 'N/A')],
+        ['Total Players', str(overview.get('total_players', 0))],
+        ['Total Goals', str(overview.get('total_goals', 0))],
+        ['Total Assists', str(overview.get('total_assists', 0))],
+        ['Avg. Age', f"{overview.get('avg_age', 0)} años"]
+    ]
+
+def _player_kpi_rows(overview: Dict) -> List[List[str]]:
+    """Filas KPI del análisis de jugador."""
+    return [
+        ['Métrica', 'Valor'],
+        ['Player', overview.get('name', 'N/A')],
+        ['Team', overview.get('team', 'N/A')],
+        ['Age', f"{overview.get('age', 0)} años"],
+        ['Position', overview.get('position_group', 'N/A')],
+        ['Matches Played', str(overview.get('matches_played', 0))]
+    ]
+
+# Constructor de filas KPI por nivel de análisis (cualquier otro nivel usa el de jugador)
+_KPI_BUILDERS = {
+    'league': _league_kpi_rows,
+    'team': _team_kpi_rows,
+    'player': _player_kpi_rows,
+}
+
+def _kpi_rows(overview: Dict, level: str) -> List[List[str]]:
+    """Devuelve las filas KPI del nivel indicado."""
+    return _KPI_BUILDERS.get(level, _player_kpi_rows)(overview)
+
+# Hoja de estilos base, creada una sola vez al importar el módulo
+_STYLES = getSampleStyleSheet()
+
+@lru_cache(maxsize=64)
+def _parsed_frags(text: str, style: ParagraphStyle) -> Tuple:
+    """Fragmentos de ReportLab para un texto fijo, analizados una sola vez por estilo."""
+    return tuple(Paragraph(text, style).frags)
+
+def _fixed_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """
+    Paragraph nuevo para títulos, pies y mensajes de texto fijo.
+    
+    Evita repetir el análisis del marcado en cada reporte; cada Paragraph
+    recibe copias de los fragmentos, ya que wrap/split no deben compartirlos
+    entre documentos que se construyen en paralelo.
+    """
+    return Paragraph(text, style, frags=[frag.clone() for frag in _parsed_frags(text, style)])
+
 class SportsPDFGenerator:
     """
     Generador de reportes PDF para dashboards deportivos.
     Versión simplificada con mejor manejo de errores.
+    
+    Los estilos son atributos de clase: se construyen una vez al importar
+    el módulo y se comparten entre instancias y reportes.
     """
     
-    def __init__(self):
-        """Inicializa el generador con estilos básicos."""
-        self.styles = getSampleStyleSheet()
-        
-        # Crear estilos personalizados
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            spaceAfter=30,
-            alignment=1,  # Center
-            textColor=colors.darkblue
-        )
-        
-        self.subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            spaceAfter=20,
-            textColor=colors.darkgreen
-        )
-        
-        self.normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=12
-        )
+    styles = _STYLES
+    
+    def __init__(self, compress: bool = True):
+        """
+        Args:
+            compress: Comprime con zlib los contenidos de cada página. Con
+                False el PDF sale sin comprimir, para quien aplique su propia
+                capa de compresión.
+        """
+        self._doc_kw = {**self._DOC_TEMPLATE_KW, 'pageCompression': 1 if compress else 0}
+    
+    # Configuración de página común a todos los reportes (márgenes por defecto de ReportLab)
+    _DOC_TEMPLATE_KW = dict(
+        pagesize=A4,
+        leftMargin=inch,
+        rightMargin=inch,
+        topMargin=inch,
+        bottomMargin=inch,
+        # Salida determinista (fechas e ID fijos): un mismo reporte produce
+        # los mismos bytes y las cachés por hash pueden deduplicarlo
+        invariant=1
+    )
+    
+    # Estilos personalizados
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=18,
+        spaceAfter=30,
+        alignment=1,  # Center
+        textColor=colors.darkblue
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'CustomSubtitle',
+        parent=_STYLES['Heading2'],
+        fontSize=14,
+        spaceAfter=20,
+        textColor=colors.darkgreen
+    )
+    
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=_STYLES['Normal'],
+        fontSize=10,
+        spaceAfter=12
+    )
+    
+    footer_style = ParagraphStyle('Footer', fontSize=8, alignment=1, textColor=colors.grey)
+    
+    note_style = ParagraphStyle('Note', fontSize=8, textColor=colors.grey)
+    
+    subsubtitle_scorer_style = ParagraphStyle(
+        'SubSubtitle', fontSize=12, spaceAfter=10, textColor=colors.darkred
+    )
+    
+    subsubtitle_assister_style = ParagraphStyle(
+        'SubSubtitle', fontSize=12, spaceAfter=10, textColor=colors.darkgreen
+    )
     
-    def create_performance_report(self, data: Dict, filters: Dict) -> BytesIO:
+    def create_performance_report(self, data: Dict, filters: Dict, out: Optional[BinaryIO] = None) -> BinaryIO:
         """
         Crea un reporte PDF de performance.
         
         Args:
             data: Diccionario con datos de performance
             filters: Filtros aplicados al reporte
+            out: Archivo o buffer binario del llamador donde escribir el PDF
+                directamente (opcional)
             
         Returns:
-            BytesIO object con el PDF generado
+            BytesIO object con el PDF generado, o `out` si se indicó
         """
         try:
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-            story = []
+            buffer = _get_pooled_buffer() if out is None else out
             
-            # Título principal
-            title = Paragraph("PERFORMANCE REPORT", self.title_style)
-            story.append(title)
-            story.append(Spacer(1, 20))
+            doc = SimpleDocTemplate(buffer, **self._doc_kw)
             
-            # Información de generación
-            timestamp = datetime.now().strftime("%d/%m/%Y %H:%M")
-            info_text = f"Completed on: {timestamp}"
-            story.append(Paragraph(info_text, self.normal_style))
-            story.append(Spacer(1, 10))
-            
-            # Secciones principales - Usando try/except para mayor robustez
-            try:
-                # Información de filtros
-                filter_info = self._create_filter_section(filters)
-                story.extend(filter_info)
-                story.append(Spacer(1, 20))
-            except Exception as e:
-                logger.warning(f"Error generando sección de filtros: {e}")
-                story.append(Paragraph("Error when generating filter information", self.normal_style))
+            # Título principal e información de generación; cada sección se
+            # añade con su separador en una sola operación
+            timestamp = _report_timestamp()
+            story = [
+                _fixed_paragraph("PERFORMANCE REPORT", self.title_style),
+                Spacer(1, 20),
+                Paragraph(f"Completed on: {timestamp}", self.normal_style),
+                Spacer(1, 10),
+            ]
             
-            # Determinar nivel de análisis y agregar secciones apropiadas
+            # Secciones del reporte según los datos disponibles, decididas de
+            # antemano: (descripción para el log, constructor, alto del separador,
+            # mensaje si falla). Un fallo solo omite su sección.
             analysis_level = filters.get('analysis_level', 'league')
-            
-            # Métricas principales (KPIs)
+            sections = [
+                ("sección de filtros", partial(self._create_filter_section, filters), 20,
+                 "Error when generating filter information"),
+            ]
             if 'overview' in data:
-                try:
-                    kpi_section = self._create_kpi_section(data['overview'], analysis_level)
-                    story.extend(kpi_section)
-                    story.append(Spacer(1, 20))
-                except Exception as e:
-                    logger.warning(f"Error generando KPIs: {e}")
-                    story.append(Paragraph("Failure to generate key metrics", self.normal_style))
+                sections.append(("KPIs", partial(self._create_kpi_section, data['overview'], analysis_level),
+                                 20, "Failure to generate key metrics"))
             
-            # Secciones específicas según el nivel de análisis
             if analysis_level == 'league':
-                # Top performers y análisis por posición
                 if 'top_performers' in data:
-                    try:
-                        top_section = self._create_top_performers_section(data['top_performers'])
-                        story.extend(top_section)
-                        story.append(Spacer(1, 20))
-                    except Exception as e:
-                        logger.warning(f"Error generando sección top performers: {e}")
-                
+                    sections.append(("sección top performers",
+                                     partial(self._create_top_performers_section, data['top_performers']),
+                                     20, None))
                 if 'position_analysis' in data:
-                    try:
-                        position_section = self._create_position_analysis_section(data['position_analysis'])
-                        story.extend(position_section)
-                    except Exception as e:
-                        logger.warning(f"Error generando análisis por posición: {e}")
-            
+                    sections.append(("análisis por posición",
+                                     partial(self._create_position_analysis_section, data['position_analysis']),
+                                     None, None))
             elif analysis_level == 'team' and 'top_players' in data:
-                try:
-                    team_section = self._create_team_analysis_section(data['top_players'])
-                    story.extend(team_section)
-                except Exception as e:
-                    logger.warning(f"Error generando análisis de equipo: {e}")
-            
+                sections.append(("análisis de equipo",
+                                 partial(self._create_team_analysis_section, data['top_players']), None, None))
             elif analysis_level == 'player' and 'basic_info' in data:
+                sections.append(("análisis de jugador",
+                                 partial(self._create_player_analysis_section, data), None, None))
+            
+            for label, build_section, spacer_height, error_text in sections:
                 try:
-                    player_section = self._create_player_analysis_section(data)
-                    story.extend(player_section)
+                    section = build_section()
                 except Exception as e:
-                    logger.warning(f"Error generando análisis de jugador: {e}")
+                    logger.warning("Error generando %s: %s", label, e)
+                    if error_text:
+                        story.append(_fixed_paragraph(error_text, self.normal_style))
+                    continue
+                # Una sección vacía no deja separador huérfano
+                if not section:
+                    continue
+                story += section
+                if spacer_height is not None:
+                    story.append(Spacer(1, spacer_height))
             
             # Pie de página
-            story.append(Spacer(1, 30))
-            footer = Paragraph(
-                "Report generated by the Hong Kong Premier League Dashboard - Performance Management",
-                ParagraphStyle('Footer', fontSize=8, alignment=1, textColor=colors.grey)
-            )
-            story.append(footer)
+            story += [
+                Spacer(1, 30),
+                _fixed_paragraph(
+                    "Report generated by the Hong Kong Premier League Dashboard - Performance Management",
+                    self.footer_style
+                ),
+            ]
             
             # Construir PDF
             doc.build(story)
-            buffer.seek(0)
-            return buffer
+            return _finish_buffer(buffer, out)
             
         except Exception as e:
-            logger.error(f"Error generando reporte PDF de performance: {e}")
-            # Crear un PDF de error básico
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-            story = [
-                Paragraph("ERROR IN REPORT GENERATION", self.title_style),
-                Spacer(1, 20),
-                Paragraph(f"An error occurred while generating the report: {str(e)}", self.normal_style)
-            ]
-            doc.build(story)
-            buffer.seek(0)
-            return buffer
+            logger.error("Error generando reporte PDF de performance: %s", e)
+            return self._error_pdf(str(e), out)
     
-    def create_injury_report(self, data: List[Dict], filters: Dict, summary_stats: Dict) -> BytesIO:
+    def create_injury_report(self, data: List[Dict], filters: Dict, summary_stats: Dict,
+                             out: Optional[BinaryIO] = None) -> BinaryIO:
         """
         Crea un reporte PDF de lesiones.
         
@@ -169,107 +404,147 @@ class SportsPDFGenerator:
             data: Lista de diccionarios con datos de lesiones
             filters: Filtros aplicados al reporte
             summary_stats: Estadísticas resumidas
+            out: Archivo o buffer binario del llamador donde escribir el PDF
+                directamente (opcional)
             
         Returns:
-            BytesIO object con el PDF generado
+            BytesIO object con el PDF generado, o `out` si se indicó
         """
         try:
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-            story = []
+            buffer = _get_pooled_buffer() if out is None else out
+            doc = SimpleDocTemplate(buffer, **self._doc_kw)
             
-            # Título principal
-            title = Paragraph("INJURIES REPORT", self.title_style)
-            story.append(title)
-            story.append(Spacer(1, 20))
+            # Información de generación y filtros en un único párrafo (mismo
+            # estilo), separados por una línea en blanco
+            timestamp = _report_timestamp()
+            info_text = (
+                f"Completed on: {timestamp}<br/><br/>"
+                f"<b>Filters applied:</b><br/>"
+                f"Type of analysis: {filters.get('analysis_type', 'N/A')}<br/>"
+                f"Team: {filters.get('team', 'Todos')}<br/>"
+                f"Period: {filters.get('period', 'N/A')}"
+            )
             
-            # Información de generación
-            timestamp = datetime.now().strftime("%d/%m/%Y %H:%M")
-            info_text = f"Completed on: {timestamp}"
-            story.append(Paragraph(info_text, self.normal_style))
-            story.append(Spacer(1, 10))
+            # Cada sección se añade con su separador en una sola operación
+            story = [
+                _fixed_paragraph("INJURIES REPORT", self.title_style),
+                Spacer(1, 20),
+                Paragraph(info_text, self.normal_style),
+                Spacer(1, 20),
+            ]
             
-            # Información de filtros
-            filter_text = f"<b>Filters applied:</b><br/>"
-            filter_text += f"Type of analysis: {filters.get('analysis_type', 'N/A')}<br/>"
-            filter_text += f"Team: {filters.get('team', 'Todos')}<br/>"
-            filter_text += f"Period: {filters.get('period', 'N/A')}<br/>"
-            story.append(Paragraph(filter_text, self.normal_style))
-            story.append(Spacer(1, 20))
+            total_records = len(data)
             
             # Resumen estadístico
             try:
-                summary_section = self._create_injury_summary_section(summary_stats, len(data))
-                story.extend(summary_section)
-                story.append(Spacer(1, 20))
+                summary_section = self._create_injury_summary_section(summary_stats, total_records)
+                story += [*summary_section, Spacer(1, 20)]
             except Exception as e:
-                logger.warning(f"Error generando resumen de lesiones: {e}")
-                story.append(Paragraph("Error when generating summary statistics", self.normal_style))
+                logger.warning("Error generando resumen de lesiones: %s", e)
+                story.append(_fixed_paragraph("Error when generating summary statistics", self.normal_style))
             
             # Tabla de lesiones
             if data:
                 try:
-                    table_section = self._create_injury_table_section(data)
+                    table_section = self._create_injury_table_section(data, total_records)
                     story.extend(table_section)
                 except Exception as e:
-                    logger.warning(f"Error generando tabla de lesiones: {e}")
-                    story.append(Paragraph("Error when generating injury table", self.normal_style))
+                    logger.warning("Error generando tabla de lesiones: %s", e)
+                    story.append(_fixed_paragraph("Error when generating injury table", self.normal_style))
             
             # Pie de página
-            footer = Paragraph(
-                "Report generated by the Hong Kong Premier League Dashboard - Injury Management",
-                ParagraphStyle('Footer', fontSize=8, alignment=1, textColor=colors.grey)
-            )
-            story.append(Spacer(1, 30))
-            story.append(footer)
+            story += [
+                Spacer(1, 30),
+                _fixed_paragraph(
+                    "Report generated by the Hong Kong Premier League Dashboard - Injury Management",
+                    self.footer_style
+                ),
+            ]
             
             # Construir PDF
             doc.build(story)
-            buffer.seek(0)
-            return buffer
+            return _finish_buffer(buffer, out)
             
         except Exception as e:
-            logger.error(f"Error generando reporte PDF de lesiones: {e}")
-            # Crear un PDF de error básico
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-            story = [
-                Paragraph("ERROR IN REPORT GENERATION", self.title_style),
-                Spacer(1, 20),
-                Paragraph(f"An error occurred while generating the report: {str(e)}", self.normal_style)
-            ]
-            doc.build(story)
-            buffer.seek(0)
-            return buffer
+            logger.error("Error generando reporte PDF de lesiones: %s", e)
+            return self._error_pdf(str(e), out)
     
-    # ----- Métodos privados auxiliares (simplificados) -----
+    def _error_pdf(self, message: str, out: Optional[BinaryIO] = None) -> BinaryIO:
+        """
+        Genera el PDF de error que sustituye a un reporte fallido.
+        
+        Args:
+            message: Descripción del error mostrada en el PDF
+            out: Destino del llamador (opcional), como en create_*_report
+        """
+        buffer = _get_pooled_buffer() if out is None else out
+        doc = SimpleDocTemplate(buffer, **self._doc_kw)
+        story = [
+            _fixed_paragraph("ERROR IN REPORT GENERATION", self.title_style),
+            Spacer(1, 20),
+            Paragraph(f"An error occurred while generating the report: {message}", self.normal_style)
+        ]
+        doc.build(story)
+        return _finish_buffer(buffer, out)
+    
+    # Método público de cada tipo de reporte aceptado por generate_batch
+    REPORT_METHODS = {
+        'performance': 'create_performance_report',
+        'injury': 'create_injury_report',
+    }
+    
+    @classmethod
+    def generate_batch(cls, report_specs: Sequence[Tuple], max_workers: Optional[int] = None) -> List[BytesIO]:
+        """
+        Genera varios reportes en paralelo con un pool de hilos.
+        
+        La compresión zlib de doc.build libera el GIL, así que los lotes
+        grandes (p. ej. un reporte por equipo o jugador) se solapan en parte.
+        
+        Args:
+            report_specs: Tuplas (tipo, *argumentos) con tipo 'performance'
+                (data, filters) o 'injury' (data, filters, summary_stats)
+            max_workers: Hilos del pool (por defecto, os.cpu_count())
+            
+        Returns:
+            Lista de BytesIO en el mismo orden que report_specs
+        """
+        def build(spec):
+            kind, *args = spec
+            # Cada hilo usa su propia instancia
+            return getattr(cls(), cls.REPORT_METHODS[kind])(*args)
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(build, report_specs))
     
+    # ----- Métodos privados auxiliares (simplificados) -----
+
     def _create_filter_section(self, filters: Dict) -> List:
         """Crea la sección de filtros aplicados."""
         elements = []
         
-        subtitle = Paragraph("Applied Filters", self.subtitle_style)
+        subtitle = _fixed_paragraph("Applied Filters", self.subtitle_style)
         elements.append(subtitle)
         
-        filter_text = ""
+        filter_parts = []
         if filters.get('analysis_level'):
-            level_names = {'league': 'Full League', 'team': 'Team', 'player': 'Player'}
-            filter_text += f"<b>Analysis Level:</b> {level_names.get(filters['analysis_level'], filters['analysis_level'])}<br/>"
+            level_name = _LEVEL_NAMES.get(filters['analysis_level'], filters['analysis_level'])
+            filter_parts.append(f"<b>Analysis Level:</b> {level_name}")
         
         if filters.get('team'):
-            filter_text += f"<b>Team:</b> {filters['team']}<br/>"
+            filter_parts.append(f"<b>Team:</b> {filters['team']}")
         
         if filters.get('player'):
-            filter_text += f"<b>Player:</b> {filters['player']}<br/>"
+            filter_parts.append(f"<b>Player:</b> {filters['player']}")
         
         if filters.get('position_filter') and filters.get('position_filter') != 'all':
-            filter_text += f"<b>Position:</b> {filters['position_filter']}<br/>"
+            filter_parts.append(f"<b>Position:</b> {filters['position_filter']}")
         
         if filters.get('age_range'):
             age_range = filters['age_range']
-            filter_text += f"<b>Age Range:</b> {age_range[0]} - {age_range[1]} años<br/>"
+            filter_parts.append(f"<b>Age Range:</b> {age_range[0]} - {age_range[1]} años")
         
-        elements.append(Paragraph(filter_text, self.normal_style))
+        elements.append(Paragraph("<br/>".join(filter_parts), self.normal_style))
         
         return elements
     
@@ -277,133 +552,77 @@ class SportsPDFGenerator:
         """Crea la sección de métricas principales."""
         elements = []
         
-        subtitle = Paragraph("Main Metrics", self.subtitle_style)
+        subtitle = _fixed_paragraph("Main Metrics", self.subtitle_style)
         elements.append(subtitle)
         
         # Datos KPI según nivel
-        if level == 'league':
-            kpi_data = [
-                ['Métrica', 'Valor'],
-                ['Total Players', str(overview.get('total_players', 0))],
-                ['Total Teams', str(overview.get('total_teams', 0))],
-                ['Total Goals', str(overview.get('total_goals', 0))],
-                ['Total Assists', str(overview.get('total_assists', 0))],
-                ['Avg. Age', f"{overview.get('average_age', 0)} años"],
-                ['Goals per Player', str(overview.get('avg_goals_per_player', 0))]
-            ]
-        elif level == 'team':
-            kpi_data = [
-                ['Métrica', 'Valor'],
-                ['Team', overview.get('team_name', 'N/A')],
-                ['Total Players', str(overview.get('total_players', 0))],
-                ['Total Goals', str(overview.get('total_goals', 0))],
-                ['Total Assists', str(overview.get('total_assists', 0))],
-                ['Avg. Age', f"{overview.get('avg_age', 0)} años"]
-            ]
-        else:  # player
-            kpi_data = [
-                ['Métrica', 'Valor'],
-                ['Player', overview.get('name', 'N/A')],
-                ['Team', overview.get('team', 'N/A')],
-                ['Age', f"{overview.get('age', 0)} años"],
-                ['Position', overview.get('position_group', 'N/A')],
-                ['Matches Played', str(overview.get('matches_played', 0))]
-            ]
+        kpi_data = _kpi_rows(overview, level)
         
         # Crear tabla de KPIs
         table = Table(kpi_data)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(_KPI_STYLE)
         
         elements.append(table)
         return elements
     
     def _create_top_performers_section(self, top_performers: Dict) -> List:
         """Crea la sección de top performers."""
+        scorers, assisters = _top_performer_rows(top_performers)
+        
+        # Sin datos no se genera ni el subtítulo
+        if not scorers and not assisters:
+            return []
+        
         elements = []
         
-        subtitle = Paragraph("Top Performers", self.subtitle_style)
+        subtitle = _fixed_paragraph("Top Performers", self.subtitle_style)
         elements.append(subtitle)
         
         # Top goleadores
-        if 'top_scorers' in top_performers and top_performers['top_scorers']:
-            elements.append(Paragraph("Top Goleadores", 
-                ParagraphStyle('SubSubtitle', fontSize=12, spaceAfter=10, textColor=colors.darkred)))
+        if scorers:
+            elements.append(_fixed_paragraph("Top Goleadores", self.subsubtitle_scorer_style))
             
-            scorer_data = [['Pos.', 'Player', 'Team', 'Goals']]
-            for i, scorer in enumerate(top_performers['top_scorers'][:5], 1):
-                scorer_data.append([
-                    str(i),
-                    scorer.get('Player', 'N/A'),
-                    scorer.get('Team', 'N/A'),
-                    str(scorer.get('Goals', 0))
-                ])
+            scorer_data = _ranked_rows(['Pos.', 'Player', 'Team', 'Goals'], scorers, _SCORER_GET, 'Goals')
             
-            table = self._create_table(scorer_data, colors.darkred)
+            table = self._create_table(scorer_data, _SCORER_STYLE)
             elements.append(table)
             elements.append(Spacer(1, 15))
         
         # Top asistentes
-        if 'top_assisters' in top_performers and top_performers['top_assisters']:
-            elements.append(Paragraph("Top Asisters", 
-                ParagraphStyle('SubSubtitle', fontSize=12, spaceAfter=10, textColor=colors.darkgreen)))
+        if assisters:
+            elements.append(_fixed_paragraph("Top Asisters", self.subsubtitle_assister_style))
             
-            assister_data = [['Pos.', 'Player', 'Team', 'Assists']]
-            for i, assister in enumerate(top_performers['top_assisters'][:5], 1):
-                assister_data.append([
-                    str(i),
-                    assister.get('Player', 'N/A'),
-                    assister.get('Team', 'N/A'),
-                    str(assister.get('Assists', 0))
-                ])
+            assister_data = _ranked_rows(['Pos.', 'Player', 'Team', 'Assists'], assisters, _ASSISTER_GET, 'Assists')
             
-            table = self._create_table(assister_data, colors.darkgreen)
+            table = self._create_table(assister_data, _ASSISTER_STYLE)
             elements.append(table)
         
         return elements
     
-    def _create_table(self, data: List[List[str]], header_color=colors.grey) -> Table:
+    def _create_table(self, data: List[List[str]], style: TableStyle = _DEFAULT_TABLE_STYLE) -> Table:
         """Método auxiliar para crear tablas con formato estándar."""
         table = Table(data)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), header_color),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(style)
         return table
     
     def _create_position_analysis_section(self, position_analysis: Dict) -> List:
         """Crea la sección de análisis por posición."""
+        if not position_analysis:
+            return []
+        
         elements = []
         
-        subtitle = Paragraph("Position Analysis", self.subtitle_style)
+        subtitle = _fixed_paragraph("Position Analysis", self.subtitle_style)
         elements.append(subtitle)
         
         # Crear tabla con estadísticas por posición
-        position_data = [['Pos.', 'Players', 'Goals', 'Avg. Age']]
-        
-        for position, stats in position_analysis.items():
-            position_data.append([
-                position,
-                str(stats.get('player_count', 0)),
-                str(stats.get('total_goals', 0)),
-                f"{stats.get('avg_age', 0)} años"
-            ])
+        position_data = [['Pos.', 'Players', 'Goals', 'Avg. Age']] + [
+            [position, str(stats.get('player_count', 0)), str(stats.get('total_goals', 0)),
+             f"{stats.get('avg_age', 0)} años"]
+            for position, stats in position_analysis.items()
+        ]
         
-        table = self._create_table(position_data, colors.darkblue)
+        table = self._create_table(position_data, _POSITION_STYLE)
         elements.append(table)
         return elements
     
@@ -411,45 +630,47 @@ class SportsPDFGenerator:
         """Crea la sección de análisis del equipo."""
         elements = []
         
-        subtitle = Paragraph("Team Analysis", self.subtitle_style)
+        subtitle = _fixed_paragraph("Team Analysis", self.subtitle_style)
         elements.append(subtitle)
         
-        team_text = ""
+        team_parts = []
         if 'top_scorer' in top_players:
             top_scorer = top_players['top_scorer']
-            team_text += f"<b>Top Scorer:</b> {top_scorer.get('name', 'N/A')} ({top_scorer.get('goals', 0)} goles)<br/>"
+            team_parts.append(f"<b>Top Scorer:</b> {top_scorer.get('name', 'N/A')} ({top_scorer.get('goals', 0)} goles)")
         
         if 'top_assister' in top_players:
             top_assister = top_players['top_assister']
-            team_text += f"<b>Top Asister:</b> {top_assister.get('name', 'N/A')} ({top_assister.get('assists', 0)} asistencias)<br/>"
+            team_parts.append(f"<b>Top Asister:</b> {top_assister.get('name', 'N/A')} ({top_assister.get('assists', 0)} asistencias)")
         
         if 'most_played' in top_players:
             most_played = top_players['most_played']
-            team_text += f"<b>Most Minutes:</b> {most_played.get('name', 'N/A')} ({most_played.get('minutes', 0)} minutos)<br/>"
+            team_parts.append(f"<b>Most Minutes:</b> {most_played.get('name', 'N/A')} ({most_played.get('minutes', 0)} minutos)")
         
-        elements.append(Paragraph(team_text, self.normal_style))
+        elements.append(Paragraph("<br/>".join(team_parts), self.normal_style))
         return elements
     
     def _create_player_analysis_section(self, data: Dict) -> List:
         """Crea la sección de análisis del jugador."""
         elements = []
         
-        subtitle = Paragraph("Player Analysis", self.subtitle_style)
+        subtitle = _fixed_paragraph("Player Analysis", self.subtitle_style)
         elements.append(subtitle)
         
         basic_info = data.get('basic_info', {})
         performance = data.get('performance_stats', {})
         
-        player_text = f"<b>Basic Info:</b><br/>"
-        player_text += f"Name: {basic_info.get('name', 'N/A')}<br/>"
-        player_text += f"Team: {basic_info.get('team', 'N/A')}<br/>"
-        player_text += f"Age: {basic_info.get('age', 'N/A')} años<br/>"
-        player_text += f"Position: {basic_info.get('position_group', 'N/A')}<br/><br/>"
-        
-        player_text += f"<b>Performance Stats:</b><br/>"
-        player_text += f"Goals: {performance.get('goals', 0)}<br/>"
-        player_text += f"Assists: {performance.get('assists', 0)}<br/>"
-        player_text += f"Minutes per Game: {performance.get('minutes_per_match', 0):.1f}<br/>"
+        # Un único f-string (los literales adyacentes se unen al compilar)
+        player_text = (
+            f"<b>Basic Info:</b><br/>"
+            f"Name: {basic_info.get('name', 'N/A')}<br/>"
+            f"Team: {basic_info.get('team', 'N/A')}<br/>"
+            f"Age: {basic_info.get('age', 'N/A')} años<br/>"
+            f"Position: {basic_info.get('position_group', 'N/A')}<br/><br/>"
+            f"<b>Performance Stats:</b><br/>"
+            f"Goals: {performance.get('goals', 0)}<br/>"
+            f"Assists: {performance.get('assists', 0)}<br/>"
+            f"Minutes per Game: {performance.get('minutes_per_match', 0):.1f}<br/>"
+        )
         
         elements.append(Paragraph(player_text, self.normal_style))
         return elements
@@ -458,7 +679,7 @@ class SportsPDFGenerator:
         """Crea la sección de resumen de lesiones."""
         elements = []
         
-        subtitle = Paragraph("Injury summary", self.subtitle_style)
+        subtitle = _fixed_paragraph("Injury summary", self.subtitle_style)
         elements.append(subtitle)
         
         summary_data = [
@@ -471,62 +692,47 @@ class SportsPDFGenerator:
         ]
         
         table = Table(summary_data)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkred),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightpink),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(_INJURY_SUMMARY_STYLE)
         
         elements.append(table)
         return elements
     
-    def _create_injury_table_section(self, data: List[Dict]) -> List:
-        """Crea la sección de tabla de lesiones."""
+    def _create_injury_table_section(self, data: List[Dict], total_records: int,
+                                     row_limit: int = INJURY_TABLE_MAX_ROWS) -> List:
+        """
+        Crea la sección de tabla de lesiones.
+        
+        Solo se leen las primeras `row_limit` lesiones de `data`; un valor mayor
+        permite exportar el registro completo.
+        """
         elements = []
         
-        subtitle = Paragraph("Injury register", self.subtitle_style)
+        subtitle = _fixed_paragraph("Injury register", self.subtitle_style)
         elements.append(subtitle)
         
-        # Limitar a 20 registros para el PDF
-        display_data = data[:20] if len(data) > 20 else data
-        
-        # Crear tabla de lesiones
-        table_data = [['Player', 'Team', 'Type', 'Zone', 'Severity', 'Date', 'State']]
-        
-        for injury in display_data:
-            table_data.append([
-                injury.get('player_name', 'N/A'),
-                injury.get('team', 'N/A'),
-                injury.get('injury_type', 'N/A'),
-                injury.get('body_part', 'N/A'),
-                injury.get('severity', 'N/A'),
-                injury.get('injury_date', 'N/A'),
-                injury.get('status', 'N/A')
-            ])
-        
-        table = Table(table_data)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkred),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 8),
-            ('FONTSIZE', (0, 1), (-1, -1), 7),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        # Crear tabla de lesiones, limitada a row_limit registros sin copiar la lista
+        injuries = list(islice(data, row_limit))
+        try:
+            # Un único itemgetter por fila cuando los registros están completos
+            values = [_INJURY_GET(injury) for injury in injuries]
+        except KeyError:
+            # Los campos que faltan se leen de los valores por defecto
+            values = [_INJURY_GET(ChainMap(injury, _INJURY_DEFAULTS)) for injury in injuries]
+        # Los campos nulos se muestran igual que los ausentes
+        rows = [['N/A' if value is None else value for value in row] for row in values]
+        table_data = [['Player', 'Team', 'Type', 'Zone', 'Severity', 'Date', 'State']] + rows
+        
+        # LongTable calcula los anchos con las filas que caben en cada página y
+        # divide por filas; la cabecera se repite si la tabla continúa
+        table = LongTable(table_data, repeatRows=1, splitByRow=1)
+        table.setStyle(_INJURY_TABLE_STYLE)
         
         elements.append(table)
         
-        if len(data) > 20:
-            note = Paragraph(f"Note: The first 20 records of {len(data)} total.", 
-                ParagraphStyle('Note', fontSize=8, textColor=colors.grey))
+        if total_records > row_limit:
+            note = Paragraph(
+                f"Note: The first {row_limit} records of {total_records} total.", self.note_style
+            )
             elements.append(Spacer(1, 10))
             elements.append(note)
         
@@ -4,8 +4,9 @@ Evita duplicación de código en performance_callbacks.py
 """
 
 from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
 import logging
-from utils.common import validate_filters, safe_get_analysis_level
+from utils.common import validate_filters_with_level
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +21,11 @@ def validate_performance_data(performance_data: Any, context: str = "") -> bool:
     Returns:
         True si los datos son válidos
     """
-    if not performance_data or 'error' in performance_data:
-        if context:
-            logger.warning(f"Datos no válidos en {context}")
-        return False
-    return True
+    # Los datos vacíos o None se descartan sin buscar la clave 'error'
+    is_valid = bool(performance_data) and 'error' not in performance_data
+    if context and not is_valid:
+        logger.warning("Datos no válidos en %s", context)
+    return is_valid
 
 def get_analysis_title(filters: Dict, performance_data: Dict) -> str:
     """
@@ -37,31 +38,84 @@ def get_analysis_title(filters: Dict, performance_data: Dict) -> str:
     Returns:
         Título formateado
     """
-    filters = validate_filters(filters)
-    analysis_level = safe_get_analysis_level(filters)
-    season = filters.get('season', 'N/A')
+    filters, analysis_level = validate_filters_with_level(filters)
     
+    # Nombre del equipo o jugador analizado (_NO_SUBJECT si los datos no
+    # corresponden al nivel; un nombre None se muestra tal cual)
+    subject = _NO_SUBJECT
+    if analysis_level == 'team' and 'overview' in performance_data:
+        subject = performance_data['overview'].get('team_name', 'Equipo')
+    elif analysis_level == 'player' and 'basic_info' in performance_data:
+        subject = performance_data['basic_info'].get('name', 'Jugador')
+    
+    age_range = filters.get('age_range')
+    fingerprint = (
+        analysis_level,
+        filters.get('season', 'N/A'),
+        filters.get('position_filter'),
+        tuple(age_range) if isinstance(age_range, list) else age_range,
+        subject
+    )
+    try:
+        return _analysis_title(*fingerprint)
+    except TypeError:
+        # Algún valor no es hashable (p. ej. una temporada en lista): sin caché
+        return _analysis_title.__wrapped__(*fingerprint)
+
+# Marca de "sin equipo ni jugador" en la huella del título
+_NO_SUBJECT = object()
+
+@lru_cache(maxsize=128, typed=True)
+def _analysis_title(analysis_level: str, season: Any, position_filter: Any,
+                    age_range: Any, subject: Any) -> str:
+    """Título memoizado por la huella de los filtros (nivel, temporada, posición, edad y nombre)."""
     # Crear sufijo de filtros
     filter_info = []
-    if filters.get('position_filter') and filters.get('position_filter') != 'all':
-        filter_info.append(f"Pos: {filters['position_filter']}")
-    if filters.get('age_range') and filters['age_range'] != [15, 45]:
-        filter_info.append(f"Edad: {filters['age_range'][0]}-{filters['age_range'][1]}")
+    if position_filter and position_filter != 'all':
+        filter_info.append(f"Pos: {position_filter}")
+    if age_range and age_range != (15, 45):
+        filter_info.append(f"Edad: {age_range[0]}-{age_range[1]}")
     
     filter_suffix = f" ({', '.join(filter_info)})" if filter_info else ""
     
     # Generar título según nivel
     if analysis_level == 'league':
         return f"Liga de Hong Kong - {season}{filter_suffix}"
-    elif analysis_level == 'team' and 'overview' in performance_data:
-        team_name = performance_data['overview'].get('team_name', 'Equipo')
-        return f"{team_name} - {season}{filter_suffix}"
-    elif analysis_level == 'player' and 'basic_info' in performance_data:
-        player_name = performance_data['basic_info'].get('name', 'Jugador')
-        return f"{player_name} - {season}"
+    elif analysis_level == 'team' and subject is not _NO_SUBJECT:
+        return f"{subject} - {season}{filter_suffix}"
+    elif analysis_level == 'player' and subject is not _NO_SUBJECT:
+        return f"{subject} - {season}"
     else:
         return "Datos no disponibles"
 
+# Plantillas de KPIs por nivel de análisis: clave requerida en los datos,
+# ancho de columna y filas (origen, clave, valor por defecto, etiqueta,
+# color, formato). Sin formato se usa el valor tal cual.
+_KPI_TEMPLATES = {
+    'league': ('overview', 2, (
+        ('overview', 'total_players', 0, 'Jugadores', 'primary', None),
+        ('overview', 'total_teams', 0, 'Equipos', 'success', None),
+        ('overview', 'total_goals', 0, 'Goles Totales', 'warning', None),
+        ('overview', 'total_assists', 0, 'Asistencias', 'info', None),
+        ('overview', 'average_age', 0, 'Edad Promedio', 'secondary', str),
+        ('overview', 'avg_goals_per_player', 0, 'Goles/Jugador', 'primary', str),
+    )),
+    'team': ('overview', 3, (
+        ('overview', 'total_players', 0, 'Jugadores', 'primary', None),
+        ('overview', 'total_goals', 0, 'Goles Totales', 'warning', None),
+        ('overview', 'total_assists', 0, 'Asistencias', 'info', None),
+        ('overview', 'avg_age', 0, 'Edad Promedio', 'secondary', str),
+    )),
+    'player': ('basic_info', 2, (
+        ('basic_info', 'age', 'N/A', 'Edad', 'primary', None),
+        ('basic_info', 'matches_played', 0, 'Partidos', 'success', None),
+        ('performance_stats', 'goals', 0, 'Goles', 'warning', None),
+        ('performance_stats', 'assists', 0, 'Asistencias', 'info', None),
+        ('basic_info', 'position_group', 'N/A', 'Posición', 'secondary', None),
+        ('performance_stats', 'minutes_per_match', 0, 'Min/Partido', 'primary', '{:.0f}'.format),
+    )),
+}
+
 def create_kpi_structure(analysis_level: str, data: Dict) -> List[Dict]:
     """
     Crea estructura de KPIs basada en el nivel de análisis.
@@ -73,39 +127,16 @@ def create_kpi_structure(analysis_level: str, data: Dict) -> List[Dict]:
     Returns:
         Lista de diccionarios con estructura de KPIs
     """
-    if analysis_level == 'league' and 'overview' in data:
-        overview = data['overview']
-        return [
-            {'value': overview.get('total_players', 0), 'label': 'Jugadores', 'color': 'primary', 'md': 2},
-            {'value': overview.get('total_teams', 0), 'label': 'Equipos', 'color': 'success', 'md': 2},
-            {'value': overview.get('total_goals', 0), 'label': 'Goles Totales', 'color': 'warning', 'md': 2},
-            {'value': overview.get('total_assists', 0), 'label': 'Asistencias', 'color': 'info', 'md': 2},
-            {'value': f"{overview.get('average_age', 0)}", 'label': 'Edad Promedio', 'color': 'secondary', 'md': 2},
-            {'value': f"{overview.get('avg_goals_per_player', 0)}", 'label': 'Goles/Jugador', 'color': 'primary', 'md': 2}
-        ]
+    template = _KPI_TEMPLATES.get(analysis_level)
+    if template is None or template[0] not in data:
+        return []
     
-    elif analysis_level == 'team' and 'overview' in data:
-        overview = data['overview']
-        return [
-            {'value': overview.get('total_players', 0), 'label': 'Jugadores', 'color': 'primary', 'md': 3},
-            {'value': overview.get('total_goals', 0), 'label': 'Goles Totales', 'color': 'warning', 'md': 3},
-            {'value': overview.get('total_assists', 0), 'label': 'Asistencias', 'color': 'info', 'md': 3},
-            {'value': f"{overview.get('avg_age', 0)}", 'label': 'Edad Promedio', 'color': 'secondary', 'md': 3}
-        ]
-    
-    elif analysis_level == 'player' and 'basic_info' in data:
-        basic_info = data['basic_info']
-        performance_stats = data.get('performance_stats', {})
-        return [
-            {'value': basic_info.get('age', 'N/A'), 'label': 'Edad', 'color': 'primary', 'md': 2},
-            {'value': basic_info.get('matches_played', 0), 'label': 'Partidos', 'color': 'success', 'md': 2},
-            {'value': performance_stats.get('goals', 0), 'label': 'Goles', 'color': 'warning', 'md': 2},
-            {'value': performance_stats.get('assists', 0), 'label': 'Asistencias', 'color': 'info', 'md': 2},
-            {'value': basic_info.get('position_group', 'N/A'), 'label': 'Posición', 'color': 'secondary', 'md': 2},
-            {'value': f"{performance_stats.get('minutes_per_match', 0):.0f}", 'label': 'Min/Partido', 'color': 'primary', 'md': 2}
-        ]
-    
-    return []
+    _, md, rows = template
+    kpis = []
+    for source, key, default, label, color, fmt in rows:
+        value = data.get(source, {}).get(key, default)
+        kpis.append({'value': fmt(value) if fmt else value, 'label': label, 'color': color, 'md': md})
+    return kpis
 
 def handle_performance_error(error: Exception, context: str) -> Dict:
     """
@@ -118,9 +149,25 @@ def handle_performance_error(error: Exception, context: str) -> Dict:
     Returns:
         Diccionario con estructura de error
     """
-    logger.error(f"Error en {context}: {str(error)}")
+    logger.error("Error en %s: %s", context, error)
     return {"error": f"Error {context}: {str(error)}"}
 
+# Configuración fija de cada tipo de gráfico; get_chart_config solo añade el título
+_BASE_CHART_CONFIG = {'height': 400, 'showlegend': False}
+_CHART_TEMPLATES = {
+    'bar': {
+        **_BASE_CHART_CONFIG,
+        'color_continuous_scale': 'Blues',
+        'labels': {'x': 'Elementos', 'y': 'Valores'}
+    },
+    'pie': _BASE_CHART_CONFIG,
+    'scatter': {
+        **_BASE_CHART_CONFIG,
+        'labels': {'x': 'X', 'y': 'Y'},
+        'hover_name': 'Elemento'
+    },
+}
+
 def get_chart_config(chart_type: str, data: Dict, title: str) -> Dict:
     """
     Genera configuración estándar para gráficos.
@@ -131,25 +178,10 @@ def get_chart_config(chart_type: str, data: Dict, title: str) -> Dict:
         title: Título del gráfico
         
     Returns:
-        Configuración del gráfico
+        Configuración del gráfico (un dict nuevo en cada llamada)
     """
-    base_config = {
-        'title': title,
-        'height': 400,
-        'showlegend': False
-    }
-    
-    if chart_type == 'bar':
-        base_config.update({
-            'color_continuous_scale': 'Blues',
-            'labels': {'x': 'Elementos', 'y': 'Valores'}
-        })
-    elif chart_type == 'pie':
-        base_config['height'] = 400
-    elif chart_type == 'scatter':
-        base_config.update({
-            'labels': {'x': 'X', 'y': 'Y'},
-            'hover_name': 'Elemento'
-        })
-    
-    return base_config
\ No newline at end of file
+    config = {'title': title, **_CHART_TEMPLATES.get(chart_type, _BASE_CHART_CONFIG)}
+    # Copia de las etiquetas para que el llamador pueda modificarlas sin tocar la plantilla
+    if 'labels' in config:
+        config['labels'] = dict(config['labels'])
+    return config